@@ -1,6 +1,4 @@
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QDir
@@ -9,6 +7,27 @@ from PySide6.QtGui import QPalette, QColor
 from src.gui.main_window import MainWindow
 from src.core.backup_engine import backup_engine
 
+def _build_palette() -> QPalette:
+    """Build the light Fusion palette used by the application"""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(248, 248, 248))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(50, 49, 48))
+    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(243, 242, 241))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(50, 49, 48))
+    palette.setColor(QPalette.ColorRole.Text, QColor(50, 49, 48))
+    palette.setColor(QPalette.ColorRole.Button, QColor(243, 242, 241))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(50, 49, 48))
+    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
+    palette.setColor(QPalette.ColorRole.Link, QColor(0, 120, 212))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 120, 212))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
+    return palette
+
+# Built once at import so theme setup is a single setPalette call
+_PALETTE = _build_palette()
+
 class BackupApp(QApplication):
     def __init__(self, argv):
         super().__init__(argv)
@@ -21,22 +40,7 @@ class BackupApp(QApplication):
         
     def setup_theme(self):
         self.setStyle("Fusion")
-        
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(248, 248, 248))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(50, 49, 48))
-        palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(243, 242, 241))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(50, 49, 48))
-        palette.setColor(QPalette.ColorRole.Text, QColor(50, 49, 48))
-        palette.setColor(QPalette.ColorRole.Button, QColor(243, 242, 241))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(50, 49, 48))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        palette.setColor(QPalette.ColorRole.Link, QColor(0, 120, 212))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(0, 120, 212))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-        self.setPalette(palette)
+        self.setPalette(_PALETTE)
     
     def run(self):
         self.main_window = MainWindow()
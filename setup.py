@@ -24,6 +24,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/backup-manager-pro",
     packages=find_packages(),
+    py_modules=["main"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
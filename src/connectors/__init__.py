@@ -3,7 +3,21 @@
 Target connectors for different backup destinations
 """
 
+import importlib
+
 from .local_target import LocalTargetConnector
-from .gdrive_connector import GoogleDriveConnector
+
+# Cloud connectors are imported on first access so local-only use doesn't pay for them
+_LAZY_CONNECTORS = {
+    'GoogleDriveConnector': '.gdrive_connector',
+}
 
 __all__ = ['LocalTargetConnector', 'GoogleDriveConnector']
+
+def __getattr__(name):
+    if name in _LAZY_CONNECTORS:
+        module = importlib.import_module(_LAZY_CONNECTORS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
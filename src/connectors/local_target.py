@@ -1,18 +1,241 @@
 import os
+import sys
+import stat
+import threading
+import time
+import errno
+import ctypes
+import ctypes.util
+import mmap
 import shutil
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 from ..utils.crypto import file_hasher
 from ..utils.logging_config import get_logger
 
 logger = get_logger('local_target')
 
+# Default buffer size for copies that go through userspace
+DEFAULT_COPY_BUFFER_SIZE = 4 << 20
+
+# Files at least this large bypass the page cache when copied through userspace
+DIRECT_IO_THRESHOLD = 16 << 20
+
+# Number of target file info entries kept by get_file_info, and how long
+# (seconds) each is trusted before the file is stat'ed again
+FILE_INFO_CACHE_SIZE = 4096
+FILE_INFO_CACHE_TTL = 2.0
+
+# Highest counter tried when renaming conflicting files
+MAX_RENAME_COUNTER = 9999
+
+# Linux ioctl that makes a file share the extents of another (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Errors that mean a kernel copy primitive is unsupported for this pair of files
+_FAST_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+def _load_syncfs():
+    """Look up syncfs(2) in libc, or None where it is not available"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        return libc.syncfs
+    except (OSError, AttributeError):
+        return None
+
+_syncfs = _load_syncfs()
+
+def sync_filesystem(path: str) -> bool:
+    """
+    Flush all dirty data of the filesystem holding path to stable storage
+    
+    Uses a single syncfs(2) for that filesystem on Linux and falls back to a
+    global sync() on other POSIX systems.
+    
+    Returns:
+        True if a flush was issued
+    """
+    try:
+        if _syncfs is not None:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                if _syncfs(fd) == 0:
+                    return True
+                err = ctypes.get_errno()
+                logger.warning("syncfs failed for %s: %s", path, os.strerror(err))
+            finally:
+                os.close(fd)
+        
+        if hasattr(os, 'sync'):
+            os.sync()
+            return True
+    except OSError as e:
+        logger.warning("Failed to flush filesystem for %s: %s", path, e)
+    
+    return False
+
+def fadvise(fd: int, advice: str):
+    """Give the kernel a page cache hint for fd where posix_fadvise is supported"""
+    if hasattr(os, 'posix_fadvise') and hasattr(os, advice):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass  # Only a hint
+
+def _same_size_and_mtime(source_path: str, target_path: str) -> bool:
+    """Check whether target looks like an unchanged copy of source"""
+    try:
+        src_st = os.stat(source_path)
+        dst_st = os.stat(target_path)
+    except OSError:
+        return False
+    
+    # copystat() carries the mtime over, so only allow for sub-microsecond rounding
+    return (src_st.st_size == dst_st.st_size and
+            abs(src_st.st_mtime_ns - dst_st.st_mtime_ns) < 1000)
+
+def fast_copy(source: str, target: str, buffer_size: int = DEFAULT_COPY_BUFFER_SIZE):
+    """
+    Copy file contents without bouncing the data through Python buffers
+    
+    Tries copy_file_range (in-kernel, reflink on Btrfs/XFS). Large files that
+    can't be copied in-kernel are read with O_DIRECT; otherwise sendfile is
+    used, and finally a buffered userspace copy.
+    """
+    src_fd = os.open(source, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+    try:
+        fadvise(src_fd, 'POSIX_FADV_SEQUENTIAL')
+        dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                         getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            _copy_fd(src_fd, dst_fd, source, os.fstat(src_fd).st_size, buffer_size)
+            # A backup reads each file once, so don't let it evict other cached data
+            fadvise(dst_fd, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(dst_fd)
+        fadvise(src_fd, 'POSIX_FADV_DONTNEED')
+    finally:
+        os.close(src_fd)
+
+def _copy_fd(src_fd: int, dst_fd: int, source: str, size: int, buffer_size: int):
+    """Copy the contents of src_fd to dst_fd using the fastest available primitive"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            copied = 0
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+                if not n:
+                    break
+                copied += n
+            # Some filesystems report 0 before the real end of the file
+            # instead of failing; finish those with the paths below, which
+            # continue from the current fd offsets
+            if copied >= size:
+                return
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+    
+    if size >= DIRECT_IO_THRESHOLD and _direct_copy(source, dst_fd, buffer_size):
+        return
+    
+    if hasattr(os, 'sendfile') and os.name == 'posix':
+        try:
+            while os.sendfile(dst_fd, src_fd, None, 1 << 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+    
+    with open(src_fd, 'rb', closefd=False) as fsrc, open(dst_fd, 'wb', closefd=False) as fdst:
+        shutil.copyfileobj(fsrc, fdst, buffer_size)
+
+def _direct_copy(source: str, dst_fd: int, buffer_size: int) -> bool:
+    """
+    Copy a large file by reading it with O_DIRECT into a page-aligned buffer
+    
+    Skips the page cache on the read side, which is useless for a file read
+    once. Returns False without copying anything if O_DIRECT is unavailable
+    or rejected by the filesystem.
+    """
+    if not hasattr(os, 'O_DIRECT') or os.lseek(dst_fd, 0, os.SEEK_CUR) != 0:
+        return False
+    
+    try:
+        fd = os.open(source, os.O_RDONLY | os.O_DIRECT | getattr(os, 'O_CLOEXEC', 0))
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return False
+        raise
+    
+    try:
+        # Anonymous mmap memory is page aligned, as O_DIRECT requires
+        with mmap.mmap(-1, buffer_size) as buf:
+            with memoryview(buf) as view:
+                first_read = True
+                while True:
+                    try:
+                        n = os.readv(fd, [buf])
+                    except OSError as e:
+                        if first_read and e.errno == errno.EINVAL:
+                            return False
+                        raise
+                    first_read = False
+                    if not n:
+                        return True
+    
+                    written = 0
+                    while written < n:
+                        written += os.write(dst_fd, view[written:n])
+    finally:
+        os.close(fd)
+
+def _drop_cached_pages(path: str):
+    """Tell the kernel the cached pages of a file won't be read again soon"""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    except OSError:
+        return
+    try:
+        fadvise(fd, 'POSIX_FADV_DONTNEED')
+    finally:
+        os.close(fd)
+
+def _remove_file(path: str):
+    """Delete a file, ignoring it if it is already gone"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 class LocalTargetConnector:
-    """Handles local file system backup operations"""
+    """
+    Handles local file system backup operations
     
-    def __init__(self):
+    The caller owns the connector's lifecycle: either call cleanup() when done or
+    use it as a context manager, e.g. ``with LocalTargetConnector(config) as target:``.
+    """
+    
+    def __init__(self, target_config: Optional[dict] = None):
+        self.target_config = target_config
         self.temp_dir = None
+        self.target_root = None
+        self.verify_checksum = False
+        self.hash_algorithm = None
+        self.copy_buffer_size = DEFAULT_COPY_BUFFER_SIZE
+        self.reflink_supported = False
+        self._created_dirs = set()
+        self._file_info_cache = OrderedDict()
+        self._file_info_lock = threading.Lock()
     
     def initialize(self, target_config: dict) -> bool:
         """Initialize the local target connector"""
@@ -25,15 +248,28 @@ class LocalTargetConnector:
             # Ensure target directory exists
             target_dir = Path(target_path)
             target_dir.mkdir(parents=True, exist_ok=True)
+            self.target_root = str(target_dir)
+            
+            # Verify copies: hash the source while copying, then re-read and hash the
+            # copy. Without it nothing is hashed and the kernel copies the data.
+            self.verify_checksum = bool(target_config.get('verify_checksum', False))
+            self.hash_algorithm = target_config.get('hash_algorithm')
+            
+            # Buffer for userspace copies, rounded to whole pages so it can be used for O_DIRECT
+            buffer_size = int(target_config.get('copy_buffer_size', DEFAULT_COPY_BUFFER_SIZE))
+            self.copy_buffer_size = max(mmap.PAGESIZE, buffer_size - buffer_size % mmap.PAGESIZE)
             
-            # Create temporary directory for staging
-            self.temp_dir = tempfile.mkdtemp(prefix='backup_staging_')
+            # Keep staging on the target filesystem so publishing a file is an atomic rename
+            staging_dir = target_dir / '.staging'
+            staging_dir.mkdir(exist_ok=True)
+            self.temp_dir = str(staging_dir)
+            self.reflink_supported = self._probe_reflink()
             
-            logger.info(f"Local target initialized: {target_path}")
+            logger.info("Local target initialized: %s", target_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize local target: {e}")
+            logger.error("Failed to initialize local target: %s", e)
             return False
     
     def upload_file(self, source_path: str, target_path: str, 
@@ -50,49 +286,172 @@ class LocalTargetConnector:
             Tuple of (success: bool, final_path: Optional[str])
         """
         try:
-            source = Path(source_path)
-            target = Path(target_path)
+            final_path, _ = self.transfer_file(source_path, target_path, conflict_policy)
+            return True, final_path
+        except Exception as e:
+            logger.error("Failed to copy file %s: %s", source_path, e)
+            return False, None
+    
+    def transfer_file(self, source_path: str, target_path: str,
+                      conflict_policy: str = 'rename') -> Tuple[str, Optional[str]]:
+        """
+        Copy a file to the local target, raising on failure
+        
+        Like upload_file, but errors propagate to the caller and the source
+        hash is returned when one was computed.
+        
+        Returns:
+            Tuple of (final_path, source_hash). final_path is the existing target
+            if the file was unchanged or skipped; source_hash is None unless the
+            copy was verified with a checksum.
+        """
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Source file does not exist: {source_path}")
+        
+        # Create target directory if it doesn't exist
+        target_dir, target_name = os.path.split(target_path)
+        self.ensure_directory(target_dir)
+        
+        # Handle file conflicts
+        final_target = target_path
+        if os.path.exists(target_path):
+            # Quick check like rsync: same size and mtime means the file is unchanged
+            if _same_size_and_mtime(source_path, target_path):
+                logger.debug("Unchanged since last backup: %s", source_path)
+                return target_path, None
+            
+            resolved = self._handle_conflict(Path(target_path), conflict_policy)
+            if resolved is None:
+                logger.info("Skipped existing file: %s", target_path)
+                return target_path, None  # Consider skip as success
+            final_target = os.fspath(resolved)
+            target_dir, target_name = os.path.split(final_target)
+        
+        # Perform atomic copy using a temporary file. Each copy gets its own
+        # name, since concurrent uploads can resolve to the same target.
+        fd, temp_file = tempfile.mkstemp(dir=target_dir, prefix=f".{target_name}.", suffix=".tmp")
+        os.close(fd)
+        
+        source_hash = None
+        try:
+            if self.reflink_supported and self._reflink(source_path, temp_file):
+                # The clone shares the source's extents, so verifying it would be tautological
+                pass
+            elif self.verify_checksum:
+                # Copy file to temporary location, hashing the source on the way
+                source_hash, target_hash = file_hasher.copy_and_hash(
+                    source_path, temp_file, algorithm=self.hash_algorithm, verify=True
+                )
+                # Backup data won't be read again soon, keep it from evicting hotter pages
+                _drop_cached_pages(source_path)
+                _drop_cached_pages(temp_file)
+                
+                # Verify integrity
+                if source_hash != target_hash:
+                    raise IOError(f"Integrity check failed for {source_path}")
+            else:
+                # No hash needed, let the kernel move the bytes
+                self._fast_copy(source_path, temp_file)
             
-            if not source.exists():
-                logger.error(f"Source file does not exist: {source_path}")
-                return False, None
+            shutil.copystat(source_path, temp_file)
             
-            # Create target directory if it doesn't exist
-            target.parent.mkdir(parents=True, exist_ok=True)
+            # Atomically move to final location
+            published = self._publish(temp_file, target_path, final_target, conflict_policy)
+            if published is None:
+                _remove_file(temp_file)
+                logger.info("Skipped existing file: %s", target_path)
+                return target_path, None
+            final_target = published
+            self._invalidate_file_info(final_target)
             
-            # Handle file conflicts
-            final_target = self._handle_conflict(target, conflict_policy)
-            if final_target is None:
-                logger.info(f"Skipped existing file: {target}")
-                return True, str(target)  # Consider skip as success
+            logger.debug("Successfully copied: %s -> %s", source_path, final_target)
+            return final_target, source_hash
             
-            # Perform atomic copy using temporary file
-            temp_file = final_target.parent / f".{final_target.name}.tmp"
+        except Exception:
+            # Clean up temp file on failure
+            _remove_file(temp_file)
+            raise
+    
+    def _publish(self, temp_file: str, target_path: str, final_target: str,
+                 conflict_policy: str) -> Optional[str]:
+        """
+        Atomically give a finished temp file its final name
+        
+        Unless overwriting, the file is published with a hard link, which fails
+        instead of clobbering a file that appeared after the conflict check
+        (e.g. from a concurrent upload), and the conflict is resolved again.
+        
+        Returns:
+            The final path, or None if the file should be skipped
+        """
+        if conflict_policy == 'overwrite' or not hasattr(os, 'link'):
+            os.replace(temp_file, final_target)
+            return final_target
+        
+        while True:
+            try:
+                os.link(temp_file, final_target)
+            except FileExistsError:
+                resolved = self._handle_conflict(Path(target_path), conflict_policy)
+                if resolved is None:
+                    return None
+                if os.fspath(resolved) == final_target:
+                    # No free name left, fall back to overwriting like _handle_conflict does
+                    os.replace(temp_file, final_target)
+                    return final_target
+                final_target = os.fspath(resolved)
+                continue
+            except OSError:
+                # Filesystem without hard link support
+                os.replace(temp_file, final_target)
+                return final_target
             
+            _remove_file(temp_file)
+            return final_target
+    
+    def ensure_directory(self, directory: str):
+        """Create a target directory, remembering the ones already created"""
+        if directory and directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def _probe_reflink(self) -> bool:
+        """Check whether the target filesystem can clone files (FICLONE)"""
+        if fcntl is None or not sys.platform.startswith('linux'):
+            return False
+        
+        probe_source = os.path.join(self.temp_dir, '.reflink_probe_src')
+        probe_target = os.path.join(self.temp_dir, '.reflink_probe_dst')
+        try:
+            with open(probe_source, 'wb') as f:
+                f.write(b'\0' * mmap.PAGESIZE)
+            return self._reflink(probe_source, probe_target)
+        except OSError:
+            return False
+        finally:
+            _remove_file(probe_source)
+            _remove_file(probe_target)
+    
+    def _reflink(self, source: str, target: str) -> bool:
+        """Clone source into target without copying data; False if the filesystem refuses"""
+        src_fd = os.open(source, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        try:
+            dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                             getattr(os, 'O_CLOEXEC', 0), 0o644)
             try:
-                # Copy file to temporary location
-                shutil.copy2(source, temp_file)
-                
-                # Verify integrity
-                if not file_hasher.verify_file_integrity(str(source), str(temp_file)):
-                    logger.error(f"Integrity check failed for {source_path}")
-                    temp_file.unlink(missing_ok=True)
-                    return False, None
-                
-                # Atomically move to final location
-                temp_file.replace(final_target)
-                
-                logger.debug(f"Successfully copied: {source_path} -> {final_target}")
-                return True, str(final_target)
-                
-            except Exception as e:
-                # Clean up temp file on failure
-                temp_file.unlink(missing_ok=True)
-                raise e
-                
-        except Exception as e:
-            logger.error(f"Failed to copy file {source_path}: {e}")
-            return False, None
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return True
+            except OSError:
+                # Different filesystems or no reflink support
+                return False
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    
+    def _fast_copy(self, source: str, target: str):
+        """Copy file contents with the connector's configured buffer size"""
+        fast_copy(source, target, self.copy_buffer_size)
     
     def _handle_conflict(self, target_path: Path, policy: str) -> Optional[Path]:
         """
@@ -109,22 +468,34 @@ class LocalTargetConnector:
         elif policy == 'overwrite':
             return target_path
         elif policy == 'rename':
-            # Find unique name by adding counter
-            counter = 1
+            # Find unique name by adding counter. Renamed copies are numbered
+            # consecutively, so probe 1, 2, 4, 8... until a free slot and then
+            # binary search back to the first free counter.
             stem = target_path.stem
             suffix = target_path.suffix
             
-            while True:
-                new_name = f"{stem}_{counter}{suffix}"
-                new_path = target_path.parent / new_name
-                if not new_path.exists():
-                    return new_path
-                counter += 1
-                
-                # Safety check to prevent infinite loop
-                if counter > 9999:
-                    logger.warning(f"Too many conflicts for {target_path}, using overwrite")
+            def candidate(counter: int) -> Path:
+                return target_path.parent / f"{stem}_{counter}{suffix}"
+            
+            if not candidate(1).exists():
+                return candidate(1)
+            
+            taken, free = 1, 2
+            while candidate(free).exists():
+                # Safety check to prevent endless probing
+                if free >= MAX_RENAME_COUNTER:
+                    logger.warning("Too many conflicts for %s, using overwrite", target_path)
                     return target_path
+                taken, free = free, min(free * 2, MAX_RENAME_COUNTER)
+            
+            while free - taken > 1:
+                middle = (taken + free) // 2
+                if candidate(middle).exists():
+                    taken = middle
+                else:
+                    free = middle
+            
+            return candidate(free)
         
         return target_path
     
@@ -134,7 +505,7 @@ class LocalTargetConnector:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            logger.error(f"Failed to create directory {dir_path}: {e}")
+            logger.error("Failed to create directory %s: %s", dir_path, e)
             return False
     
     def file_exists(self, file_path: str) -> bool:
@@ -143,57 +514,93 @@ class LocalTargetConnector:
     
     def get_file_info(self, file_path: str) -> Optional[dict]:
         """Get information about a file in the target"""
+        now = time.monotonic()
+        with self._file_info_lock:
+            entry = self._file_info_cache.get(file_path)
+            if entry is not None:
+                info, cached_at = entry
+                # Changes made outside upload_file are picked up once the entry expires
+                if now - cached_at < FILE_INFO_CACHE_TTL:
+                    self._file_info_cache.move_to_end(file_path)
+                    return dict(info)
+                del self._file_info_cache[file_path]
+        
         try:
-            path = Path(file_path)
-            if not path.exists():
-                return None
-            
-            stat = path.stat()
-            return {
-                'size': stat.st_size,
-                'modified': stat.st_mtime,
-                'created': stat.st_ctime,
-                'is_directory': path.is_dir()
-            }
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Failed to get file info for {file_path}: {e}")
+            logger.error("Failed to get file info for %s: %s", file_path, e)
             return None
+        
+        info = {
+            'size': st.st_size,
+            'modified': st.st_mtime,
+            'created': st.st_ctime,
+            'is_directory': stat.S_ISDIR(st.st_mode)
+        }
+        
+        with self._file_info_lock:
+            self._file_info_cache[file_path] = (info, now)
+            if len(self._file_info_cache) > FILE_INFO_CACHE_SIZE:
+                self._file_info_cache.popitem(last=False)
+        
+        return dict(info)
+    
+    def _invalidate_file_info(self, file_path: str):
+        """Drop the cached info for a path that has just been written"""
+        with self._file_info_lock:
+            self._file_info_cache.pop(file_path, None)
     
     def list_files(self, directory_path: str) -> list:
         """List files in a target directory"""
         try:
-            path = Path(directory_path)
-            if not path.exists() or not path.is_dir():
+            if not os.path.isdir(directory_path):
                 return []
             
             files = []
-            for item in path.iterdir():
-                try:
-                    info = {
-                        'name': item.name,
-                        'path': str(item),
-                        'is_directory': item.is_dir(),
-                        'size': item.stat().st_size if not item.is_dir() else 0,
-                        'modified': item.stat().st_mtime
-                    }
-                    files.append(info)
-                except Exception as e:
-                    logger.warning(f"Could not get info for {item}: {e}")
+            # scandir entries carry the type (and on Windows the stat) from the directory read
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                        st = entry.stat()
+                        info = {
+                            'name': entry.name,
+                            'path': entry.path,
+                            'is_directory': is_dir,
+                            'size': st.st_size if not is_dir else 0,
+                            'modified': st.st_mtime
+                        }
+                        files.append(info)
+                    except Exception as e:
+                        logger.warning("Could not get info for %s: %s", entry.path, e)
             
             return files
         except Exception as e:
-            logger.error(f"Failed to list files in {directory_path}: {e}")
+            logger.error("Failed to list files in %s: %s", directory_path, e)
             return []
     
+    def flush(self) -> bool:
+        """Make all files written to the target durable with one filesystem-wide sync"""
+        if not self.target_root:
+            return False
+        return sync_filesystem(self.target_root)
+    
     def cleanup(self):
         """Clean up temporary resources"""
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
                 shutil.rmtree(self.temp_dir)
-                logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
+                logger.debug("Cleaned up temp directory: %s", self.temp_dir)
             except Exception as e:
-                logger.warning(f"Failed to clean up temp directory: {e}")
+                logger.warning("Failed to clean up temp directory: %s", e)
+    
+    def __enter__(self):
+        if self.target_config is not None and not self.initialize(self.target_config):
+            raise RuntimeError("Failed to initialize local target")
+        return self
     
-    def __del__(self):
-        """Ensure cleanup on destruction"""
-        self.cleanup()
\ No newline at end of file
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False
\ No newline at end of file
@@ -4,7 +4,13 @@ Core application logic and engine
 """
 
 from .backup_engine import backup_engine
-from .database import db_manager
+from .database import get_db_manager
 from .config import config_manager
 
-__all__ = ['backup_engine', 'db_manager', 'config_manager']
+__all__ = ['backup_engine', 'db_manager', 'get_db_manager', 'config_manager']
+
+def __getattr__(name):
+    # The database is opened on first access to db_manager, not at import
+    if name == 'db_manager':
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
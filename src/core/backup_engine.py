@@ -1,16 +1,36 @@
 import os
-import json
-import shutil
-import hashlib
+import re
+import fnmatch
 import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Iterator, Tuple, Pattern
+from collections import deque
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from PySide6.QtCore import QObject, Signal, QThread, QMutex, QMutexLocker
-from .database import db_manager, BackupJob, JobExecution, FileTransfer
+from PySide6.QtCore import QObject, Signal, QThread
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .database import get_db_manager, BackupJob, JobExecution, FileTransfer, FileHashCache
+from .config import get_setting
+from ..connectors.local_target import LocalTargetConnector
+from ..utils.crypto import file_hasher
+
+# Checksums are only used to verify local copies. They are stored as
+# "<tag>:<hex>" so the algorithm can change later.
+CHECKSUM_TAGS = {'blake3': 'b3', 'blake2b': 'b2b'}
+
+# Completed transfers are written to the database in batches of this many rows,
+# or at least this often (seconds)
+TRANSFER_COMMIT_BATCH_SIZE = 100
+TRANSFER_COMMIT_INTERVAL = 2.0
+
+# Progress updates and per-file log lines are sent to the GUI thread at most
+# this often (seconds), so fast small-file copies don't flood its event loop
+PROGRESS_EMIT_INTERVAL = 0.1
+LOG_FLUSH_INTERVAL = 0.5
 
 @dataclass
 class TransferItem:
@@ -18,6 +38,8 @@ class TransferItem:
     target_path: str
     file_size: int
     checksum: Optional[str] = None
+    mtime_ns: int = 0
+    transfer_id: Optional[int] = None  # FileTransfer row holding this item's plan
 
 class BackupWorker(QThread):
     """Worker thread for backup operations to avoid GUI blocking"""
@@ -25,14 +47,17 @@ class BackupWorker(QThread):
     progress_updated = Signal(int, int, str)
     log_message = Signal(str)
     backup_completed = Signal(bool, str)
+    # Emitted once the worker has actually parked after a pause request
+    pause_entered = Signal()
     
     def __init__(self, job_id):
         super().__init__()
         self.job_id = job_id
-        self.should_stop = False
-        self.is_paused = False
-        self.pause_condition = threading.Condition()
-        self.mutex = QMutex()
+        # Workers block on _resume_event while paused; stop() sets both events
+        # so nothing stays waiting once a stop has been requested
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         
     def run(self):
         """Run the backup job in a separate thread"""
@@ -46,71 +71,67 @@ class BackupWorker(QThread):
         finally:
             self.log_message.emit("Worker thread finishing")
     
+    @property
+    def should_stop(self) -> bool:
+        """Whether a stop has been requested"""
+        return self._stop_event.is_set()
+    
+    @property
+    def is_paused(self) -> bool:
+        """Whether a pause has been requested and not yet resumed"""
+        return not self._resume_event.is_set()
+    
     def stop(self):
         """Request the backup to stop"""
-        with QMutexLocker(self.mutex):
-            self.should_stop = True
-            self.log_message.emit("Stop requested for backup worker")
+        self._stop_event.set()
+        self.log_message.emit("Stop requested for backup worker")
         
         # Wake up thread if it's paused
-        with self.pause_condition:
-            self.pause_condition.notify()
+        self._resume_event.set()
     
-
     def pause(self):
-            """Pause the backup operation"""
-            try:
-                with QMutexLocker(self.mutex):
-                    if not self.is_paused:
-                        self.is_paused = True
-                        self.log_message.emit("Backup worker paused")
-                    else:
-                        self.log_message.emit("Backup worker was already paused")
-            except Exception as e:
-                self.log_message.emit(f"Error in worker pause: {e}")
-                raise
+        """Pause the backup operation"""
+        if self.is_paused:
+            self.log_message.emit("Backup worker was already paused")
+            return
         
+        self._resume_event.clear()
+        self.log_message.emit("Backup worker paused")
+    
     def resume(self):
         """Resume the backup operation"""
-        try:
-            with QMutexLocker(self.mutex):
-                if self.is_paused:
-                    self.is_paused = False
-                    self.log_message.emit("Backup worker resumed")
-                else:
-                    self.log_message.emit("Backup worker was not paused")
-            
-            # Wake up the paused thread
-            with self.pause_condition:
-                self.pause_condition.notify()
-        except Exception as e:
-            self.log_message.emit(f"Error in worker resume: {e}")
-            raise
+        if not self.is_paused:
+            self.log_message.emit("Backup worker was not paused")
+            return
         
+        # Wakes the paused thread immediately
+        self._resume_event.set()
+        self.log_message.emit("Backup worker resumed")
+    
+    def _is_pause_requested(self):
+        """Check whether a pause has been requested, without waiting"""
+        return self.is_paused
+    
     def _check_pause_stop(self):
-        """Check if we should pause or stop, and handle accordingly"""
-        with QMutexLocker(self.mutex):
-            if self.should_stop:
-                return True  # Should stop
-            
-            if self.is_paused:
-                self.log_message.emit("Backup paused - waiting for resume...")
-                
-        # Handle pause outside of mutex to avoid deadlock
-        while True:
-            with QMutexLocker(self.mutex):
-                if not self.is_paused or self.should_stop:
-                    break
-            
-            with self.pause_condition:
-                self.pause_condition.wait(1.0)  # Wait up to 1 second
+        """Check if we should pause or stop, blocking while paused"""
+        if self.should_stop:
+            return True
+        
+        if self.is_paused:
+            self.log_message.emit("Backup paused - waiting for resume...")
+            self.pause_entered.emit()
+            self._resume_event.wait()
         
-        with QMutexLocker(self.mutex):
-            return self.should_stop
+        return self.should_stop
     
     def _execute_backup(self):
         """Execute the actual backup logic"""
-        session = db_manager.get_session()
+        # One session for the whole run. This worker is the only writer of its
+        # job and execution rows, so batch commits don't need to expire and
+        # reload them.
+        session = get_db_manager().get_thread_session(expire_on_commit=False)
+        transfer_records = []
+        hash_cache_rows = []
         
         try:
             job = session.query(BackupJob).filter_by(id=self.job_id).first()
@@ -131,12 +152,12 @@ class BackupWorker(QThread):
                 self.log_message.emit("Resuming from previous paused execution")
                 execution = existing_execution
                 execution.status = 'running'
-                # Get already processed files
-                completed_transfers = session.query(FileTransfer).filter_by(
-                    execution_id=execution.id,
-                    status='completed'
-                ).all()
-                completed_paths = {t.source_path for t in completed_transfers}
+                # The plan is stored with the execution, so pick up its unfinished
+                # rows instead of rescanning. Failed files are retried.
+                successful_transfers = (execution.processed_files or 0) - (execution.failed_files or 0)
+                transfer_items = self._load_planned_transfers(session, execution)
+                if not transfer_items and successful_transfers < (execution.total_files or 0):
+                    transfer_items = None  # Paused before plans were stored, rescan
             else:
                 execution = JobExecution(
                     job_id=self.job_id,
@@ -144,40 +165,59 @@ class BackupWorker(QThread):
                     started_at=datetime.utcnow()
                 )
                 session.add(execution)
-                completed_paths = set()
+                transfer_items = None
             
             session.commit()
             
-            # Scan sources
-            self.log_message.emit("Scanning source files...")
-            if self._check_pause_stop():
-                self._handle_pause_or_stop(execution, session)
-                return
+            if transfer_items is None:
+                completed_paths = set()
+                if existing_execution:
+                    completed_paths = {
+                        path for path, in session.query(FileTransfer.source_path).filter_by(
+                            execution_id=execution.id,
+                            status='completed'
+                        )
+                    }
+                    session.commit()  # Don't keep the read transaction open while scanning
                 
-            source_files = self._scan_sources(job)
-            
-            if not source_files:
-                self.log_message.emit("No files found to backup")
-                execution.status = 'completed'
-                execution.completed_at = datetime.utcnow()
+                # Scan sources
+                self.log_message.emit("Scanning source files...")
+                if self._check_pause_stop():
+                    self._handle_pause_or_stop(execution, session)
+                    return
+                    
+                source_files = list(self._scan_sources(job))
+                
+                if not source_files:
+                    self.log_message.emit("No files found to backup")
+                    execution.status = 'completed'
+                    execution.completed_at = datetime.utcnow()
+                    session.commit()
+                    self.backup_completed.emit(True, "No files to backup")
+                    return
+                
+                # Files unchanged since their last backup count as already completed
+                unchanged_paths = self._find_unchanged_files(session, job, source_files)
+                if unchanged_paths:
+                    self.log_message.emit(f"Skipping {len(unchanged_paths)} files unchanged since the last backup")
+                    completed_paths.update(unchanged_paths)
+                
+                # Plan only the files that still need copying
+                transfer_items = self._plan_transfers(
+                    job, [f for f in source_files if f[0] not in completed_paths]
+                )
+                successful_transfers = len(completed_paths)
+                
+                self.log_message.emit(f"Found {len(source_files)} total files, {len(transfer_items)} remaining")
+                
+                # Update execution totals if this is a new execution
+                if not existing_execution:
+                    execution.total_files = len(source_files)
+                    execution.total_size = sum(source_stat.st_size for _, source_stat in source_files)
+                
+                # Store the plan with the execution so a resume doesn't need to rescan
+                self._store_transfer_plan(session, execution, transfer_items)
                 session.commit()
-                self.backup_completed.emit(True, "No files to backup")
-                return
-            
-            # Filter out already completed files
-            remaining_files = [f for f in source_files if f not in completed_paths]
-            
-            self.log_message.emit(f"Found {len(source_files)} total files, {len(remaining_files)} remaining")
-            
-            # Plan transfers for remaining files
-            transfer_items = self._plan_transfers(job, remaining_files)
-            
-            # Update execution totals if this is a new execution
-            if not existing_execution:
-                execution.total_files = len(source_files)
-                execution.total_size = sum(item.file_size for item in self._plan_transfers(job, source_files))
-            
-            session.commit()
             
             if not transfer_items:
                 self.log_message.emit("All files already completed")
@@ -190,51 +230,117 @@ class BackupWorker(QThread):
             self.log_message.emit(f"Starting transfer of {len(transfer_items)} remaining files...")
             
             # Execute transfers
-            successful_transfers = len(completed_paths)
-            failed_transfers = execution.failed_files or 0
-            
-            for i, item in enumerate(transfer_items):
-                if self._check_pause_stop():
-                    self._handle_pause_or_stop(execution, session)
-                    return
-                    
-                current_progress = successful_transfers + failed_transfers + i
-                total_files = execution.total_files
+            failed_transfers = 0
+            
+            # Keep up to max_concurrent_transfers copies running, checking for
+            # pause/stop before each new file is started. A target can set its
+            # own max_workers (SSD: 8-16, spinning disks: 2-4).
+            max_workers = max(1, int(job.target_config.get('max_workers') or
+                                     get_setting('max_concurrent_transfers') or 1))
+            pending_items = iter(transfer_items)
+            in_flight = {}
+            stopped = False
+            last_commit = time.monotonic()
+            last_progress_emit = 0.0
+            last_log_flush = time.monotonic()
+            log_lines = []
+            
+            # The global checksum setting applies unless the job sets its own
+            target_config = dict(job.target_config)
+            target_config.setdefault('verify_checksum', bool(get_setting('checksum_verification')))
+            conflict_policy = job.conflict_policy or 'rename'
+            
+            # Only local targets are planned, so the transfers always go to one.
+            # The connector does the copying and cleans up its staging area
+            # however the transfer phase ends.
+            with LocalTargetConnector(target_config) as target:
+                algorithm = target.hash_algorithm or file_hasher.DEFAULT_ALGORITHM
+                checksum_tag = CHECKSUM_TAGS.get(algorithm, algorithm)
                 
-                self.progress_updated.emit(
-                    current_progress, 
-                    total_files, 
-                    f"Copying {os.path.basename(item.source_path)}"
-                )
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    while True:
+                        while not stopped and len(in_flight) < max_workers:
+                            if in_flight and self._is_pause_requested():
+                                break  # Let running copies finish before waiting for resume
+                            if self._check_pause_stop():
+                                stopped = True
+                                break
+                            
+                            item = next(pending_items, None)
+                            if item is None:
+                                break
+                            
+                            now = time.monotonic()
+                            if now - last_progress_emit >= PROGRESS_EMIT_INTERVAL:
+                                self.progress_updated.emit(
+                                    successful_transfers + failed_transfers,
+                                    execution.total_files,
+                                    f"Copying {os.path.basename(item.source_path)}"
+                                )
+                                last_progress_emit = now
+                            future = executor.submit(self._execute_local_transfer, target, item, execution.id,
+                                                     conflict_policy, checksum_tag)
+                            in_flight[future] = item
+                        
+                        if not in_flight:
+                            break
+                        
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            item = in_flight.pop(future)
+                            record = future.result()
+                            transfer_records.append(record)
+                            if record['status'] == 'completed':
+                                successful_transfers += 1
+                                hash_cache_rows.append({
+                                    'job_id': job.id,
+                                    'source_path': item.source_path,
+                                    'mtime_ns': item.mtime_ns,
+                                    'file_size': item.file_size,
+                                    'target_path': record['target_path'],
+                                    'checksum': record.get('checksum')
+                                })
+                                execution.transferred_size += item.file_size
+                                log_lines.append(f"Successfully copied: {os.path.basename(item.source_path)}")
+                            else:
+                                failed_transfers += 1
+                                log_lines.append(f"Failed to copy: {os.path.basename(item.source_path)}")
+                        
+                        if log_lines and time.monotonic() - last_log_flush >= LOG_FLUSH_INTERVAL:
+                            self._flush_log_lines(log_lines)
+                            last_log_flush = time.monotonic()
+                        
+                        execution.processed_files = successful_transfers + failed_transfers
+                        execution.failed_files = failed_transfers
+                        
+                        # Commit transfer records and progress in batches, not per file
+                        if (len(transfer_records) >= TRANSFER_COMMIT_BATCH_SIZE or
+                                time.monotonic() - last_commit >= TRANSFER_COMMIT_INTERVAL):
+                            self._flush_transfer_records(session, execution, transfer_records, hash_cache_rows)
+                            last_commit = time.monotonic()
                 
-                if self._execute_local_transfer(item, execution.id):
-                    successful_transfers += 1
-                    execution.transferred_size += item.file_size
-                    self.log_message.emit(f"Successfully copied: {os.path.basename(item.source_path)}")
-                else:
-                    failed_transfers += 1
-                    self.log_message.emit(f"Failed to copy: {os.path.basename(item.source_path)}")
+                self._flush_log_lines(log_lines)
+                self._flush_transfer_records(session, execution, transfer_records, hash_cache_rows)
                 
-                execution.processed_files = successful_transfers + failed_transfers
-                execution.failed_files = failed_transfers
-                session.commit()
+                if stopped:
+                    self._handle_pause_or_stop(execution, session)
+                    return
                 
-                # Small delay to prevent overwhelming the system
-                self.msleep(50)
+                # Flush the copied files to disk once for the whole job
+                target.flush()
             
             # Complete the job
-            with QMutexLocker(self.mutex):
-                if not self.should_stop and not self.is_paused:
-                    execution.status = 'completed' if failed_transfers == 0 else 'completed_with_errors'
-                    execution.completed_at = datetime.utcnow()
-                    session.commit()
-                    
-                    status_msg = f"Backup completed: {successful_transfers} successful, {failed_transfers} failed"
-                    self.log_message.emit(status_msg)
-                    self.progress_updated.emit(execution.total_files, execution.total_files, "Backup completed")
-                    self.backup_completed.emit(True, status_msg)
-                else:
-                    self._handle_pause_or_stop(execution, session)
+            if not self.should_stop and not self.is_paused:
+                execution.status = 'completed' if failed_transfers == 0 else 'completed_with_errors'
+                execution.completed_at = datetime.utcnow()
+                session.commit()
+                
+                status_msg = f"Backup completed: {successful_transfers} successful, {failed_transfers} failed"
+                self.log_message.emit(status_msg)
+                self.progress_updated.emit(execution.total_files, execution.total_files, "Backup completed")
+                self.backup_completed.emit(True, status_msg)
+            else:
+                self._handle_pause_or_stop(execution, session)
         
         except Exception as e:
             error_msg = f"Backup failed: {str(e)}"
@@ -243,86 +349,225 @@ class BackupWorker(QThread):
                 execution.status = 'failed'
                 execution.error_message = str(e)
                 execution.completed_at = datetime.utcnow()
-                session.commit()
+                self._flush_transfer_records(session, execution, transfer_records, hash_cache_rows)
             except:
                 pass
             self.backup_completed.emit(False, error_msg)
         finally:
-            session.close()
+            get_db_manager().remove_session()
     
     def _handle_pause_or_stop(self, execution, session):
         """Handle pause or stop request"""
-        with QMutexLocker(self.mutex):
-            if self.should_stop:
-                execution.status = 'cancelled'
-                execution.completed_at = datetime.utcnow()
-                session.commit()
-                self.log_message.emit("Backup cancelled by user")
-                self.backup_completed.emit(False, "Cancelled by user")
-            elif self.is_paused:
-                execution.status = 'paused'
-                session.commit()
-                self.log_message.emit("Backup paused and saved")
-                self.backup_completed.emit(True, "Backup paused")
+        if self.should_stop:
+            execution.status = 'cancelled'
+            execution.completed_at = datetime.utcnow()
+            session.commit()
+            self.log_message.emit("Backup cancelled by user")
+            self.backup_completed.emit(False, "Cancelled by user")
+        elif self.is_paused:
+            execution.status = 'paused'
+            session.commit()
+            self.log_message.emit("Backup paused and saved")
+            self.backup_completed.emit(True, "Backup paused")
     
-    def _scan_sources(self, job: BackupJob) -> List[str]:
-        """Scan source directories for files"""
-        sources = json.loads(job.sources)
+    def _scan_sources(self, job: BackupJob) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Scan source directories for files
+        
+        Yields (path, stat_result) pairs as they are found. The stat comes from
+        the os.scandir entry, so planning doesn't need to stat each file again.
+        """
+        sources = job.sources
         include_patterns = job.include_patterns.split(';') if job.include_patterns else []
         exclude_patterns = job.exclude_patterns.split(';') if job.exclude_patterns else []
-        
-        all_files = []
+        should_include = self._build_file_filter(include_patterns, exclude_patterns)
         
         for source in sources:
             if self._check_pause_stop():
-                break
-                
-            source_path = Path(source)
+                return
             
-            if source_path.is_file():
-                if self._should_include_file(str(source_path), include_patterns, exclude_patterns):
-                    all_files.append(str(source_path))
-            elif source_path.is_dir():
-                for root, dirs, files in os.walk(source_path):
+            if os.path.isfile(source):
+                if should_include(source):
+                    try:
+                        yield source, os.stat(source)
+                    except OSError as e:
+                        self.log_message.emit(f"Error accessing {source}: {e}")
+            elif os.path.isdir(source):
+                pending_dirs = deque([source])
+                while pending_dirs:
                     if self._check_pause_stop():
-                        break
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if self._should_include_file(file_path, include_patterns, exclude_patterns):
-                            all_files.append(file_path)
+                        return
+                    
+                    directory = pending_dirs.popleft()
+                    try:
+                        with os.scandir(directory) as entries:
+                            for entry in entries:
+                                try:
+                                    if entry.is_dir():
+                                        # Like os.walk, don't descend into symlinked directories
+                                        if not entry.is_symlink():
+                                            pending_dirs.append(entry.path)
+                                        continue
+                                    
+                                    if should_include(entry.path):
+                                        yield entry.path, entry.stat()
+                                except OSError as e:
+                                    self.log_message.emit(f"Error accessing {entry.path}: {e}")
+                    except OSError:
+                        continue  # Unreadable directory, skipped like os.walk does
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        """
+        Compile glob patterns into combined regexes
+        
+        Patterns without a path separator are matched against the file name,
+        the rest against the full path.
         
-        return all_files
+        Returns:
+            Tuple of (name_regex, path_regex); either is None when unused
+        """
+        name_globs = []
+        path_globs = []
+        for pattern in patterns:
+            pattern = os.path.normcase(pattern.strip())
+            if not pattern:
+                continue
+            if '/' in pattern or os.sep in pattern:
+                path_globs.append(fnmatch.translate(pattern))
+            else:
+                name_globs.append(fnmatch.translate(pattern))
+        
+        name_re = re.compile('|'.join(name_globs)) if name_globs else None
+        path_re = re.compile('|'.join(path_globs)) if path_globs else None
+        return name_re, path_re
     
-    def _should_include_file(self, file_path: str, include_patterns: List[str], exclude_patterns: List[str]) -> bool:
-        """Check if file should be included based on patterns"""
-        import fnmatch
+    def _build_file_filter(self, include_patterns: List[str], exclude_patterns: List[str]) -> Callable[[str], bool]:
+        """
+        Build a predicate that checks if a file should be included based on patterns
+        
+        The predicate is specialized for the pattern configuration, so the common
+        cases don't pay for checks that can never match.
+        """
+        exc_name, exc_path = self._compile_patterns(exclude_patterns)
+        inc_name, inc_path = self._compile_patterns(include_patterns)
+        has_includes = inc_name is not None or inc_path is not None
         
-        file_name = os.path.basename(file_path)
+        if not has_includes and exc_name is None and exc_path is None:
+            return lambda file_path: True
         
-        if exclude_patterns:
-            for pattern in exclude_patterns:
-                pattern = pattern.strip()
-                if pattern and (fnmatch.fnmatch(file_name, pattern) or fnmatch.fnmatch(file_path, pattern)):
+        if exc_path is None and inc_path is None:
+            # Only file name patterns, the full path is never needed
+            def should_include_name(file_path: str) -> bool:
+                name = os.path.normcase(os.path.basename(file_path))
+                if exc_name is not None and exc_name.match(name):
                     return False
+                return inc_name is None or inc_name.match(name) is not None
+            
+            return should_include_name
         
-        if include_patterns:
-            for pattern in include_patterns:
-                pattern = pattern.strip()
-                if pattern and (fnmatch.fnmatch(file_name, pattern) or fnmatch.fnmatch(file_path, pattern)):
-                    return True
-            return False
+        def should_include(file_path: str) -> bool:
+            path = os.path.normcase(file_path)
+            name = os.path.basename(path)
+            
+            if exc_name is not None and exc_name.match(name):
+                return False
+            if exc_path is not None and exc_path.match(path):
+                return False
+            
+            if has_includes:
+                return bool((inc_name is not None and inc_name.match(name)) or
+                            (inc_path is not None and inc_path.match(path)))
+            
+            return True
         
-        return True
+        return should_include
+    
+    def _find_unchanged_files(self, session, job: BackupJob, source_files: List[Tuple[str, os.stat_result]]) -> set:
+        """
+        Find source files that haven't changed since they were last backed up
+        
+        A file is unchanged when its size and mtime match the job's hash cache
+        entry and the backed up copy still exists with the same size and mtime.
+        The cache for the job is loaded with a single query.
+        """
+        if job.target_type != "local":
+            return set()
+        
+        cached = {
+            row.source_path: row
+            for row in session.query(
+                FileHashCache.source_path, FileHashCache.mtime_ns,
+                FileHashCache.file_size, FileHashCache.target_path
+            ).filter_by(job_id=job.id)
+        }
+        # End the read transaction before stat-ing targets, so the SQLite lock
+        # isn't held across filesystem I/O
+        session.commit()
+        if not cached:
+            return set()
+        
+        unchanged = set()
+        for source_file, source_stat in source_files:
+            entry = cached.get(source_file)
+            if (entry is None or entry.mtime_ns != source_stat.st_mtime_ns or
+                    entry.file_size != source_stat.st_size):
+                continue
+            
+            try:
+                target_stat = os.stat(entry.target_path)
+            except OSError:
+                continue  # Backup copy is gone, copy the file again
+            
+            if (target_stat.st_size == source_stat.st_size and
+                    target_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                unchanged.add(source_file)
+        
+        return unchanged
+    
+    @staticmethod
+    def _reserve_target_name(target_path: Path, taken_names: Dict[str, set]) -> Path:
+        """
+        Pick a free name for target_path by appending _1, _2, ... to its stem
+        
+        Each target directory is listed once with os.scandir and cached in
+        taken_names, so collisions are resolved without a stat per candidate.
+        Reserved names are added to the cache, so two sources with the same
+        name in one run don't both map to the same target.
+        """
+        directory = str(target_path.parent)
+        names = taken_names.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                names = set()  # Directory doesn't exist yet
+            taken_names[directory] = names
+        
+        name = target_path.name
+        if os.path.normcase(name) in names:
+            stem = target_path.stem
+            suffix = target_path.suffix
+            counter = 1
+            while os.path.normcase(f"{stem}_{counter}{suffix}") in names:
+                counter += 1
+            name = f"{stem}_{counter}{suffix}"
+        
+        names.add(os.path.normcase(name))
+        return target_path.parent / name
     
-    def _plan_transfers(self, job: BackupJob, source_files: List[str]) -> List[TransferItem]:
+    def _plan_transfers(self, job: BackupJob, source_files: List[Tuple[str, os.stat_result]]) -> List[TransferItem]:
         """Plan the transfer operations"""
-        target_config = json.loads(job.target_config)
+        target_config = job.target_config
         transfer_items = []
         
         if job.target_type == "local":
             base_target = Path(target_config["local_path"])
+            # Names already in each target directory, plus the ones planned this run
+            taken_names: Dict[str, set] = {}
             
-            for source_file in source_files:
+            for source_file, source_stat in source_files:
                 if self._check_pause_stop():
                     break
                     
@@ -331,104 +576,137 @@ class BackupWorker(QThread):
                 relative_path = source_path.name
                 target_path = base_target / job.name / relative_path
                 
-                if job.conflict_policy == "rename" and target_path.exists():
-                    counter = 1
-                    stem = target_path.stem
-                    suffix = target_path.suffix
-                    while target_path.exists():
-                        target_path = target_path.parent / f"{stem}_{counter}{suffix}"
-                        counter += 1
+                if job.conflict_policy == "rename":
+                    target_path = self._reserve_target_name(target_path, taken_names)
                 
-                try:
-                    file_size = source_path.stat().st_size
-                    transfer_items.append(TransferItem(
-                        source_path=str(source_path),
-                        target_path=str(target_path),
-                        file_size=file_size
-                    ))
-                except (OSError, IOError) as e:
-                    self.log_message.emit(f"Error accessing {source_file}: {e}")
+                transfer_items.append(TransferItem(
+                    source_path=str(source_path),
+                    target_path=str(target_path),
+                    file_size=source_stat.st_size,
+                    mtime_ns=source_stat.st_mtime_ns
+                ))
         
         return transfer_items
     
-    def _execute_local_transfer(self, item: TransferItem, execution_id: int) -> bool:
-        """Execute a single file transfer"""
-        session = db_manager.get_session()
-        transfer_record = None
+    def _execute_local_transfer(self, target: LocalTargetConnector, item: TransferItem, execution_id: int,
+                                conflict_policy: str, checksum_tag: str) -> dict:
+        """
+        Execute a single file transfer through the target connector
+        
+        Doesn't touch the database; returns the FileTransfer row values so the
+        worker can update the planned rows in batches.
+        """
+        record = {
+            'id': item.transfer_id,
+            'execution_id': execution_id,
+            'source_path': item.source_path,
+            'target_path': item.target_path,
+            'file_size': item.file_size,
+            'status': 'in_progress',
+            'started_at': datetime.utcnow()
+        }
         
         try:
-            # Check if this transfer already exists and is completed
-            existing_transfer = session.query(FileTransfer).filter_by(
-                execution_id=execution_id,
-                source_path=item.source_path,
-                status='completed'
-            ).first()
-            
-            if existing_transfer:
-                return True  # Already completed
-            
-            transfer_record = FileTransfer(
-                execution_id=execution_id,
-                source_path=item.source_path,
-                target_path=item.target_path,
-                file_size=item.file_size,
-                status='in_progress',
-                started_at=datetime.utcnow()
-            )
-            session.add(transfer_record)
-            session.commit()
-            
-            target_path = Path(item.target_path)
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            temp_target = target_path.parent / f"{target_path.name}.tmp"
-            
-            # Copy file
-            shutil.copy2(item.source_path, str(temp_target))
-            
-            # Verify checksum
-            source_checksum = self._calculate_checksum(item.source_path)
-            target_checksum = self._calculate_checksum(str(temp_target))
-            
-            if source_checksum and source_checksum == target_checksum:
-                temp_target.rename(target_path)
-                
-                transfer_record.status = 'completed'
-                transfer_record.checksum = source_checksum
-                transfer_record.transferred_bytes = item.file_size
-                transfer_record.completed_at = datetime.utcnow()
-                session.commit()
-                
-                return True
-            else:
-                temp_target.unlink(missing_ok=True)
-                raise Exception("Checksum verification failed")
+            if not item.mtime_ns:
+                # Items resumed from a stored plan don't carry the source mtime
+                item.mtime_ns = os.stat(item.source_path).st_mtime_ns
+            
+            # Conflicts were mostly resolved while planning; the connector still
+            # handles files that appeared since, e.g. copies made before a pause
+            final_path, source_hash = target.transfer_file(item.source_path, item.target_path, conflict_policy)
+            
+            record['status'] = 'completed'
+            record['target_path'] = final_path
+            record['checksum'] = f"{checksum_tag}:{source_hash}" if source_hash else None
+            record['transferred_bytes'] = item.file_size
+            record['completed_at'] = datetime.utcnow()
+            return record
                 
         except Exception as e:
-            if transfer_record:
-                transfer_record.status = 'failed'
-                transfer_record.error_message = str(e)
-                transfer_record.completed_at = datetime.utcnow()
-                session.commit()
-            
-            return False
-        finally:
-            session.close()
+            record['status'] = 'failed'
+            record['error_message'] = str(e)
+            record['completed_at'] = datetime.utcnow()
+            return record
     
-    def _calculate_checksum(self, file_path: str, chunk_size: int = 8192) -> str:
-        """Calculate SHA256 checksum of a file"""
-        hash_sha256 = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
-        except (IOError, OSError):
-            return ""
+    def _flush_log_lines(self, lines: List[str]):
+        """Send buffered per-file log lines to the GUI as a single message"""
+        if lines:
+            self.log_message.emit("\n".join(lines))
+            lines.clear()
+    
+    def _store_transfer_plan(self, session, execution, transfer_items: List[TransferItem]):
+        """Insert a pending FileTransfer row for each planned item and keep the row ids"""
+        if not transfer_items:
+            return
+        
+        rows = [{
+            'execution_id': execution.id,
+            'source_path': item.source_path,
+            'target_path': item.target_path,
+            'file_size': item.file_size,
+            'status': 'pending'
+        } for item in transfer_items]
+        if session.get_bind().dialect.insert_executemany_returning:
+            transfer_ids = session.scalars(
+                insert(FileTransfer).returning(FileTransfer.id, sort_by_parameter_order=True),
+                rows
+            ).all()
+        else:
+            # SQLite before 3.35 has no RETURNING; the plan is inserted in
+            # item order, so reading the new ids back by id keeps them aligned
+            session.execute(insert(FileTransfer), rows)
+            transfer_ids = session.scalars(
+                select(FileTransfer.id)
+                .where(FileTransfer.execution_id == execution.id)
+                .order_by(FileTransfer.id.desc())
+                .limit(len(rows))
+            ).all()
+            transfer_ids.reverse()
+        
+        for item, transfer_id in zip(transfer_items, transfer_ids):
+            item.transfer_id = transfer_id
+    
+    def _load_planned_transfers(self, session, execution) -> List[TransferItem]:
+        """Load the stored plan rows of an execution that haven't completed yet"""
+        rows = session.query(
+            FileTransfer.id, FileTransfer.source_path, FileTransfer.target_path, FileTransfer.file_size
+        ).filter(
+            FileTransfer.execution_id == execution.id,
+            FileTransfer.status.in_(('pending', 'in_progress', 'failed'))
+        ).order_by(FileTransfer.id)
+        
+        return [TransferItem(
+            source_path=row.source_path,
+            target_path=row.target_path,
+            file_size=int(row.file_size or 0),
+            transfer_id=row.id
+        ) for row in rows]
+    
+    def _flush_transfer_records(self, session, execution, records: List[dict], cache_rows: List[dict]):
+        """Update buffered FileTransfer rows, upsert hash cache rows and save execution progress in one commit"""
+        if records:
+            session.bulk_update_mappings(FileTransfer, records)
+            records.clear()
+        if cache_rows:
+            stmt = sqlite_insert(FileHashCache)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['job_id', 'source_path'],
+                set_={name: stmt.excluded[name] for name in ('mtime_ns', 'file_size', 'target_path', 'checksum')}
+            )
+            session.execute(stmt, cache_rows)
+            cache_rows.clear()
+        session.commit()
 
 class BackupEngine(QObject):
     """Main backup engine with proper Qt threading support"""
     
+    # Outcomes of request_pause()/request_resume(), delivered on the GUI thread
+    backup_paused = Signal(bool)
+    backup_resumed = Signal(bool)
+    # 'running', 'paused' or 'idle', emitted whenever the engine changes state,
+    # so views can refresh on change instead of polling
+    state_changed = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.is_running = False
@@ -472,11 +750,13 @@ class BackupEngine(QObject):
         self.current_worker.progress_updated.connect(self._on_progress_updated)
         self.current_worker.log_message.connect(self._on_log_message)
         self.current_worker.backup_completed.connect(self._on_backup_completed)
+        self.current_worker.pause_entered.connect(self._on_worker_paused)
         self.current_worker.finished.connect(self._on_worker_finished)
         
         # Start the worker
         self.is_running = True
         self.current_worker.start()
+        self.state_changed.emit('running')
         
         return True
     
@@ -522,11 +802,35 @@ class BackupEngine(QObject):
             self.log("Resuming backup...")
             self.is_paused = False
             self.current_worker.resume()
+            self.state_changed.emit('running')
             return True
         except Exception as e:
             self.log(f"Failed to resume backup: {e}")
             return False
     
+    def request_pause(self):
+        """
+        Ask the running backup to pause without waiting for it
+        
+        backup_paused(True) is emitted once the worker has finished its in-flight
+        copies and parked, or backup_paused(False) if the request was refused.
+        """
+        was_paused = self.is_paused
+        if not self.pause_backup():
+            self.backup_paused.emit(False)
+        elif was_paused:
+            self.backup_paused.emit(True)
+    
+    def request_resume(self):
+        """Ask a paused backup to resume; the outcome arrives as backup_resumed"""
+        # Resuming only sets the worker's event, so the result is known at once
+        self.backup_resumed.emit(self.resume_backup())
+    
+    def _on_worker_paused(self):
+        """Handle the worker reaching its paused state"""
+        self.backup_paused.emit(True)
+        self.state_changed.emit('paused')
+    
     def _on_progress_updated(self, current: int, total: int, status: str):
         """Handle progress updates from worker thread"""
         self.update_progress(current, total, status)
@@ -540,14 +844,7 @@ class BackupEngine(QObject):
         self.log(f"Backup completed: {message}")
         if self.progress_callback:
             self.progress_callback(0, 0, "")  # Clear progress
-        
-        # Check if there are more paused backups to resume
-        try:
-            paused_executions = db_manager.get_paused_executions()
-            if paused_executions and not self.is_running:  # Only if no backup is currently running
-                QTimer.singleShot(5000, lambda: self.activity_panel.refresh_paused_jobs())
-        except Exception as e:
-            self.log(f"Error checking for additional paused backups: {e}")
+        # Remaining paused backups are picked up by views on the 'idle' state change
         
     def _on_worker_finished(self):
         """Handle worker thread finishing"""
@@ -561,6 +858,8 @@ class BackupEngine(QObject):
             self.current_worker.wait(5000)  # Wait max 5 seconds
             self.current_worker.deleteLater()
             self.current_worker = None
+        
+        self.state_changed.emit('idle')
     
     def stop_backup(self):
         """Stop the currently running backup"""
@@ -1,9 +1,15 @@
 import json
 import os
+import atexit
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+# set_setting() calls within this many seconds of each other are written to
+# disk in a single save
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 @dataclass
 class AppSettings:
     """Application settings configuration"""
@@ -54,7 +60,12 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self.config_file = self.config_dir / 'settings.json'
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self.settings = self.load_settings()
+        
+        # Write out any save still waiting on the debounce timer
+        atexit.register(self.flush)
     
     def load_settings(self) -> AppSettings:
         """Load settings from file or create defaults"""
@@ -80,14 +91,35 @@ class ConfigManager:
         if settings is None:
             settings = self.settings
         
+        # Write to a temp file and swap it in, so a crash never leaves a partial file
+        temp_file = self.config_file.with_suffix('.json.tmp')
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(asdict(settings), f, indent=2)
+            os.replace(temp_file, self.config_file)
             
             self.settings = settings
         except (IOError, OSError) as e:
             print(f"Error saving config file: {e}")
     
+    def _schedule_save(self):
+        """Save settings after SAVE_DEBOUNCE_SECONDS, restarting the wait on each call"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        """Save settings now if a debounced save is pending"""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            self.save_settings()
+    
     def get_setting(self, key: str) -> Any:
         """Get a specific setting value"""
         return getattr(self.settings, key, None)
@@ -96,10 +128,20 @@ class ConfigManager:
         """Set a specific setting value"""
         if hasattr(self.settings, key):
             setattr(self.settings, key, value)
-            self.save_settings()
+            self._schedule_save()
         else:
             raise AttributeError(f"Setting '{key}' does not exist")
     
+    def set_settings_bulk(self, values: Dict[str, Any]):
+        """Set several settings at once and save them in a single write"""
+        unknown = [key for key in values if not hasattr(self.settings, key)]
+        if unknown:
+            raise AttributeError(f"Settings do not exist: {', '.join(unknown)}")
+        
+        for key, value in values.items():
+            setattr(self.settings, key, value)
+        self._schedule_save()
+    
     def reset_to_defaults(self):
         """Reset all settings to default values"""
         self.settings = AppSettings()
@@ -150,5 +192,8 @@ def get_setting(key: str) -> Any:
 def set_setting(key: str, value: Any):
     config_manager.set_setting(key, value)
 
+def set_settings_bulk(values: Dict[str, Any]):
+    config_manager.set_settings_bulk(values)
+
 def get_settings() -> AppSettings:
     return config_manager.settings
\ No newline at end of file
@@ -1,22 +1,56 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, Text, Boolean, ForeignKey
+from sqlalchemy import (create_engine, event, select, delete, update, func, case, cast, lambda_stmt, Index, Column,
+                        Integer, String, DateTime, Float, Text, Boolean, ForeignKey, JSON)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, joinedload, selectinload, raiseload
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import os
+import atexit
 import sqlite3
+import threading
+import time
+from typing import List, Optional
 
 Base = declarative_base()
 
+# Applied to every new SQLite connection. WAL lets the GUI read while a backup
+# worker commits, and NORMAL sync only fsyncs at WAL checkpoints.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-20000",  # ~20 MB
+    "PRAGMA foreign_keys=ON",  # Needed for ON DELETE CASCADE
+)
+
+# Executions deleted per statement by cleanup_old_executions
+CLEANUP_BATCH_SIZE = 500
+
+# How long get_job_overview_rows() may answer from memory. Any commit through
+# a session from this manager invalidates the cached rows immediately.
+STATUS_CACHE_TTL = 0.5
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connection event hook that applies SQLITE_PRAGMAS"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 class BackupJob(Base):
     __tablename__ = 'backup_jobs'
     
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
-    sources = Column(Text, nullable=False)
+    sources = Column(JSON, nullable=False)  # List of source paths
     include_patterns = Column(Text)
     exclude_patterns = Column(Text)
     target_type = Column(String(50), nullable=False)
-    target_config = Column(Text)
+    target_config = Column(JSON)  # e.g. {"local_path": ...}
     conflict_policy = Column(String(50), default='rename')
     schedule_cron = Column(String(100))
     is_active = Column(Boolean, default=True)
@@ -43,19 +77,34 @@ class JobExecution(Base):
     error_message = Column(Text)
     
     job = relationship("BackupJob", back_populates="executions")
-    file_transfers = relationship("FileTransfer", back_populates="execution", cascade="all, delete-orphan")
+    file_transfers = relationship("FileTransfer", back_populates="execution", cascade="all, delete-orphan",
+                                  passive_deletes=True)
     
     def get_progress_percentage(self):
         """Calculate progress percentage"""
-        if self.total_files == 0:
+        return self.progress_percentage(self.processed_files, self.total_files)
+    
+    @staticmethod
+    def progress_percentage(processed_files, total_files):
+        """Calculate progress percentage from file counts, e.g. from column tuples"""
+        if not total_files:
             return 0
-        return min(100, int((self.processed_files / self.total_files) * 100))
+        return min(100, int(((processed_files or 0) / total_files) * 100))
     
     def get_transfer_rate_mb_per_sec(self):
         """Calculate transfer rate in MB/s"""
         if not self.started_at or self.transferred_size == 0:
             return 0
         
+        # While running, measure against the monotonic clock from when this object
+        # was loaded or created, without datetime arithmetic on every refresh
+        mono_start = getattr(self, '_mono_start', None)
+        if self.completed_at is None and mono_start is not None:
+            elapsed = time.monotonic() - mono_start
+            transferred = (self.transferred_size or 0.0) - self._mono_bytes
+            if elapsed > 0 and transferred > 0:
+                return (transferred / (1024 * 1024)) / elapsed
+        
         end_time = self.completed_at or datetime.utcnow()
         duration = (end_time - self.started_at).total_seconds()
         
@@ -64,15 +113,30 @@ class JobExecution(Base):
         
         return (self.transferred_size / (1024 * 1024)) / duration
 
+@event.listens_for(JobExecution, 'load')
+@event.listens_for(JobExecution, 'init')
+def _init_rate_tracking(target, *args):
+    """Remember the monotonic time and byte count used by get_transfer_rate_mb_per_sec"""
+    target._mono_start = time.monotonic()
+    target._mono_bytes = target.transferred_size or 0.0
+
+# Expression index for looking jobs up by their local target folder
+Index('ix_jobs_local_path', func.json_extract(BackupJob.target_config, '$.local_path'))
+
+# cleanup_old_executions seeks on status and range-scans completed_at;
+# get_paused_executions only filters on status
+Index("ix_jobexec_status_completed", JobExecution.status, JobExecution.completed_at)
+Index("ix_jobexec_status", JobExecution.status)
+
 class FileTransfer(Base):
     __tablename__ = 'file_transfers'
     
     id = Column(Integer, primary_key=True)
-    execution_id = Column(Integer, ForeignKey('job_executions.id'), nullable=False)
+    execution_id = Column(Integer, ForeignKey('job_executions.id', ondelete='CASCADE'), nullable=False)
     source_path = Column(Text, nullable=False)
     target_path = Column(Text)
     file_size = Column(Float)
-    checksum = Column(String(64))
+    checksum = Column(String(80))  # "<algorithm tag>:<hex digest>", e.g. "b3:..."
     status = Column(String(50), default='pending')  # pending, in_progress, completed, failed, skipped
     transferred_bytes = Column(Float, default=0.0)
     retry_count = Column(Integer, default=0)
@@ -82,6 +146,17 @@ class FileTransfer(Base):
     
     execution = relationship("JobExecution", back_populates="file_transfers")
 
+class FileHashCache(Base):
+    """Source file metadata and checksum from the last successful backup of each file"""
+    __tablename__ = 'file_hash_cache'
+    
+    job_id = Column(Integer, ForeignKey('backup_jobs.id'), primary_key=True)
+    source_path = Column(Text, primary_key=True)
+    mtime_ns = Column(Integer, nullable=False)
+    file_size = Column(Integer, nullable=False)
+    target_path = Column(Text, nullable=False)
+    checksum = Column(String(80))
+
 class DatabaseManager:
     def __init__(self, db_path="backup_app.db"):
         self.db_path = os.path.abspath(db_path)
@@ -89,73 +164,329 @@ class DatabaseManager:
         # Check if we need to migrate the database
         self._migrate_database_if_needed()
         
-        self.engine = create_engine(f'sqlite:///{self.db_path}')
+        # Keep a few connections open across sessions, so the GUI and the backup
+        # worker don't reopen the .db/-wal/-shm files and rerun the connect PRAGMAs
+        self.engine = create_engine(
+            f'sqlite:///{self.db_path}',
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            connect_args={'check_same_thread': False, 'timeout': 30}
+        )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # One reusable session per background thread, see get_thread_session()
+        self.ThreadSession = scoped_session(self.SessionLocal)
+        self._closed = False
+        
+        # Job status cache shared by every poller, see get_job_overview_rows()
+        self._status_lock = threading.Lock()
+        self._status_rows = None
+        self._status_cached_at = 0.0
+        self._status_generation = 0
+        event.listen(self.SessionLocal, "after_commit", self._invalidate_status_cache)
+        
+        # The GUI keeps the database open for the whole session, so analyze any
+        # stale tables once up front (the open-time setting SQLite recommends)
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize=0x10002")
+        
+        # Make sure planner statistics get refreshed however the app exits
+        atexit.register(self.close)
     
     def _migrate_database_if_needed(self):
         """Migrate database schema if needed"""
         if not os.path.exists(self.db_path):
             return  # New database, no migration needed
         
+        conn = None
         try:
-            # Connect directly with sqlite3 to check and modify schema
-            conn = sqlite3.connect(self.db_path)
+            # Connect directly with sqlite3 to check and modify schema. The
+            # transaction is managed explicitly so the whole migration is one commit.
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
             
             # Check if new columns exist
             cursor.execute("PRAGMA table_info(job_executions)")
-            columns = [column[1] for column in cursor.fetchall()]
+            columns = {column[1] for column in cursor.fetchall()}
+            if not columns:
+                cursor.execute("ROLLBACK")
+                return  # Table not created yet, create_all() will build it complete
             
-            # Add missing columns
-            if 'paused_at' not in columns:
-                cursor.execute("ALTER TABLE job_executions ADD COLUMN paused_at TIMESTAMP")
-                print("Added paused_at column to job_executions table")
+            # Collect missing columns
+            new_columns = [name for name in ('paused_at', 'resumed_at') if name not in columns]
+            statements = [f"ALTER TABLE job_executions ADD COLUMN {name} TIMESTAMP" for name in new_columns]
             
-            if 'resumed_at' not in columns:
-                cursor.execute("ALTER TABLE job_executions ADD COLUMN resumed_at TIMESTAMP")
-                print("Added resumed_at column to job_executions table")
+            # create_all() only builds indexes together with new tables
+            statements.append("CREATE INDEX IF NOT EXISTS ix_jobexec_status_completed "
+                              "ON job_executions (status, completed_at)")
+            statements.append("CREATE INDEX IF NOT EXISTS ix_jobexec_status ON job_executions (status)")
+            statements.append("CREATE INDEX IF NOT EXISTS ix_jobs_local_path "
+                              "ON backup_jobs (json_extract(target_config, '$.local_path'))")
             
-            conn.commit()
-            conn.close()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute("COMMIT")
+            
+            for name in new_columns:
+                print(f"Added {name} column to job_executions table")
+            
+            # Account for the schema changes in the planner statistics
+            cursor.execute("PRAGMA optimize")
             
         except Exception as e:
             print(f"Database migration error (non-critical): {e}")
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
             # Continue anyway - SQLAlchemy will handle it
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    def get_session(self, expire_on_commit=True):
+        return self.SessionLocal(expire_on_commit=expire_on_commit)
     
-    def get_session(self):
-        return self.SessionLocal()
+    @contextmanager
+    def session_scope(self, expire_on_commit=True):
+        """
+        Provide a session for one unit of work: commit on success, roll back
+        on error, close either way
+        
+        Meant for writes; every commit drops the job status cache, so read-only
+        code should keep using get_session() and close it.
+        """
+        session = self.get_session(expire_on_commit=expire_on_commit)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def get_thread_session(self, expire_on_commit=True):
+        """
+        Get the calling thread's cached session, creating it on first use
+        
+        Meant for worker threads; call remove_session() when the thread is done.
+        GUI code should keep using get_session(), because modal dialogs re-enter
+        the event loop and timer callbacks would close a shared session in use.
+        """
+        session = self.ThreadSession()
+        session.expire_on_commit = expire_on_commit
+        return session
+    
+    def remove_session(self):
+        """Close and discard the calling thread's cached session"""
+        self.ThreadSession.remove()
     
     def close(self):
+        """Refresh planner statistics and release all connections"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        try:
+            self.run_optimize()
+        except Exception as e:
+            print(f"Database optimize error (non-critical): {e}")
+        
         self.engine.dispose()
     
-    def get_paused_executions(self):
-        """Get all paused executions that can be resumed"""
+    def optimize(self, full=False):
+        """
+        Run database maintenance
+        
+        Args:
+            full: Also VACUUM to reclaim free pages and rewrite the file contiguously
+        """
+        # VACUUM can't run inside a transaction, so use an autocommit connection
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE")  # Exhaustive statistics, unlike optimize's sampling
+            conn.exec_driver_sql("PRAGMA optimize")
+            if full:
+                conn.exec_driver_sql("VACUUM")
+    
+    def run_optimize(self):
+        """Refresh planner statistics for tables whose row counts changed; cheap to run periodically"""
+        with self.engine.connect() as conn:
+            # Bounded ANALYZE so the call stays fast on large tables
+            conn.exec_driver_sql("PRAGMA analysis_limit=400")
+            conn.exec_driver_sql("PRAGMA optimize")
+    
+    def bulk_insert_jobs(self, rows: List[dict]) -> int:
+        """
+        Insert many backup jobs at once, e.g. when importing job definitions
+        
+        Args:
+            rows: BackupJob column values, one dict per job
+            
+        Returns:
+            Number of jobs inserted
+        """
+        if not rows:
+            return 0
+        
+        with self.session_scope() as session:
+            # One executemany on a reused statement, without unit-of-work bookkeeping
+            session.bulk_insert_mappings(BackupJob, rows)
+        return len(rows)
+    
+    def get_paused_executions(self, eager=False):
+        """
+        Get all paused executions that can be resumed
+        
+        Args:
+            eager: Also load each execution's file_transfers, in one extra
+                SELECT ... IN query for all executions instead of one per execution
+        
+        Each execution's job comes back in the same SELECT through a join, so
+        execution.job is always usable. Other relationships that aren't eagerly
+        loaded raise on access instead of silently issuing a query per object.
+        """
         session = self.get_session()
         try:
-            return session.query(JobExecution).filter_by(status='paused').all()
+            # lambda_stmt caches the compiled SQL, so repeated calls skip compilation
+            stmt = lambda_stmt(lambda: select(JobExecution).where(JobExecution.status == 'paused'))
+            stmt += lambda s: s.options(joinedload(JobExecution.job))
+            if eager:
+                stmt += lambda s: s.options(selectinload(JobExecution.file_transfers))
+            stmt += lambda s: s.options(raiseload('*'))
+            return session.execute(stmt).scalars().all()
         finally:
             session.close()
     
-    def cleanup_old_executions(self, days_to_keep=30):
-        """Clean up old completed/failed executions"""
+    def get_paused_executions_rows(self):
+        """
+        Get lightweight rows for all paused executions
+        
+        Returns immutable (id, job_id, job_name, started_at, processed_files,
+        total_files) tuples instead of ORM objects, so there is no identity map
+        overhead and nothing can trigger a lazy load after the session is closed.
+        The job name is joined in, so callers don't need a query per execution.
+        Rows come oldest first, so "resume the first paused backup" is stable.
+        """
+        session = self.get_session()
+        try:
+            return session.execute(lambda_stmt(lambda: select(
+                JobExecution.id, JobExecution.job_id, BackupJob.name.label('job_name'),
+                JobExecution.started_at, JobExecution.processed_files, JobExecution.total_files
+            ).join(BackupJob, BackupJob.id == JobExecution.job_id).where(
+                JobExecution.status == 'paused'
+            ).order_by(JobExecution.started_at, JobExecution.id))).all()
+        finally:
+            session.close()
+    
+    def _invalidate_status_cache(self, session=None):
+        """Drop cached job status rows; runs after every session commit"""
+        with self._status_lock:
+            self._status_rows = None
+            self._status_generation += 1
+    
+    def get_job_overview_rows(self):
+        """
+        Get active jobs together with their most recent execution in one query
+        
+        Returns (id, name, target_type, last_run, total_files) tuples ordered by
+        job id. SQLite formats the display strings itself: last_run reads like
+        "2024-01-31 18:05 (Failed)" or "Never", and total_files is text.
+        
+        Results are served from memory for up to STATUS_CACHE_TTL seconds, so
+        several panels polling at once cost a single query.
+        """
+        with self._status_lock:
+            if (self._status_rows is not None
+                    and time.monotonic() - self._status_cached_at < STATUS_CACHE_TTL):
+                return self._status_rows
+            generation = self._status_generation
+        
         session = self.get_session()
         try:
+            rows = session.execute(lambda_stmt(lambda: select(
+                BackupJob.id, BackupJob.name, BackupJob.target_type,
+                func.coalesce(
+                    func.strftime('%Y-%m-%d %H:%M', JobExecution.started_at).concat(case(
+                        (JobExecution.status == 'failed', ' (Failed)'),
+                        (JobExecution.status == 'completed_with_errors', ' (Errors)'),
+                        else_=''
+                    )),
+                    'Never'
+                ).label('last_run'),
+                cast(func.coalesce(JobExecution.total_files, 0), String).label('total_files')
+            ).outerjoin(JobExecution, JobExecution.id == select(JobExecution.id).where(
+                JobExecution.job_id == BackupJob.id
+            ).order_by(
+                JobExecution.started_at.desc(), JobExecution.id.desc()
+            ).limit(1).correlate(BackupJob).scalar_subquery()).where(
+                BackupJob.is_active.is_(True)
+            ).order_by(BackupJob.id))).all()
+        finally:
+            session.close()
+        
+        with self._status_lock:
+            # Don't cache rows read before a commit that landed mid-query
+            if generation == self._status_generation:
+                self._status_rows = rows
+                self._status_cached_at = time.monotonic()
+        return rows
+    
+    def deactivate_job(self, job_id: int):
+        """Soft-delete a job by marking it inactive"""
+        with self.session_scope() as session:
+            session.execute(update(BackupJob).where(BackupJob.id == job_id).values(is_active=False))
+    
+    def cancel_paused_execution(self, execution_id: int) -> bool:
+        """
+        Mark a paused execution as cancelled
+        
+        Returns False if the execution is no longer paused, e.g. because it
+        was resumed in the meantime.
+        """
+        with self.session_scope() as session:
+            result = session.execute(update(JobExecution).where(
+                JobExecution.id == execution_id, JobExecution.status == 'paused'
+            ).values(status='cancelled', completed_at=datetime.utcnow()))
+            return result.rowcount > 0
+    
+    def cleanup_old_executions(self, days_to_keep=30):
+        """Clean up old completed/failed executions"""
+        with self.session_scope() as session:
             cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-            old_executions = session.query(JobExecution).filter(
+            old_execution_ids = session.execute(lambda_stmt(lambda: select(JobExecution.id).where(
                 JobExecution.completed_at < cutoff_date,
                 JobExecution.status.in_(['completed', 'failed', 'cancelled'])
-            ).all()
-            
-            for execution in old_executions:
-                session.delete(execution)
+            ))).scalars().all()
             
-            session.commit()
-            return len(old_executions)
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+            # Bulk DELETEs in chunks, so each IN list stays well under SQLite's
+            # variable limit and each write transaction stays short. Transfers are
+            # deleted explicitly because databases created before the
+            # ON DELETE CASCADE foreign key don't cascade.
+            for start in range(0, len(old_execution_ids), CLEANUP_BATCH_SIZE):
+                chunk = old_execution_ids[start:start + CLEANUP_BATCH_SIZE]
+                session.execute(lambda_stmt(lambda: delete(FileTransfer).where(FileTransfer.execution_id.in_(chunk))))
+                session.execute(lambda_stmt(lambda: delete(JobExecution).where(JobExecution.id.in_(chunk))))
+                session.commit()
+        
+        return len(old_execution_ids)
+
+# Created on first use, so importing the models doesn't open the database
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
+
+def get_db_manager() -> DatabaseManager:
+    """Get the shared DatabaseManager, opening the database on first call"""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
 
-db_manager = DatabaseManager()
\ No newline at end of file
+def __getattr__(name):
+    # Keeps `from .database import db_manager` working, lazily
+    if name == 'db_manager':
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
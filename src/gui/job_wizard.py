@@ -1,4 +1,3 @@
-import json
 import os
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                                QLabel, QLineEdit, QTextEdit, QComboBox, QCheckBox,
@@ -6,19 +5,36 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                                QTabWidget, QWidget, QMessageBox, QFrame)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
-from ..core.database import db_manager, BackupJob
+from ..core.database import BackupJob
+
+# Shared style for primary action buttons; one string object for every instance
+PRIMARY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: 500;
+        padding: 8px 24px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+"""
 
 class ModernFrame(QFrame):
+    _STYLE = """
+        QFrame {
+            background-color: white;
+            border: 1px solid #d2d0ce;
+            border-radius: 8px;
+            padding: 16px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #d2d0ce;
-                border-radius: 8px;
-                padding: 16px;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
 
 class SourcesTab(QWidget):
     def __init__(self):
@@ -76,8 +92,13 @@ class SourcesTab(QWidget):
     
     def add_files(self):
         files, _ = QFileDialog.getOpenFileNames(self, "Select Files to Backup")
-        for file in files:
-            self.sources_list.addItem(file)
+        if files:
+            # One bulk insert and a single relayout, even for thousands of files
+            self.sources_list.setUpdatesEnabled(False)
+            try:
+                self.sources_list.addItems(files)
+            finally:
+                self.sources_list.setUpdatesEnabled(True)
     
     def remove_selected(self):
         current_row = self.sources_list.currentRow()
@@ -234,6 +255,8 @@ class ScheduleTab(QWidget):
 class JobWizard(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # The BackupJob saved by create_job, once the dialog is accepted
+        self.created_job = None
         self.init_ui()
     
     def init_ui(self):
@@ -277,19 +300,7 @@ class JobWizard(QDialog):
         
         self.create_btn = QPushButton("Create Job")
         self.create_btn.clicked.connect(self.create_job)
-        self.create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: 500;
-                padding: 8px 24px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
+        self.create_btn.setStyleSheet(PRIMARY_BUTTON_STYLE)
         buttons_layout.addWidget(self.create_btn)
         
         layout.addLayout(buttons_layout)
@@ -303,55 +314,60 @@ class JobWizard(QDialog):
             self.schedule_tab.update_preview(sources, target_type, target_config)
     
     def create_job(self):
-        if not self.validate_job():
+        fields = self.validate_job()
+        if fields is None:
             return
         
-        job_name = self.job_name_edit.text().strip()
-        sources = self.sources_tab.get_sources()
-        include_patterns = self.sources_tab.get_include_patterns()
-        exclude_patterns = self.sources_tab.get_exclude_patterns()
-        target_type = self.target_tab.get_target_type()
-        target_config = self.target_tab.get_target_config()
-        conflict_policy = self.target_tab.get_conflict_policy()
-        schedule_cron = self.schedule_tab.get_schedule_cron()
+        # Opened here rather than at import, so the wizard doesn't touch the database until needed
+        from ..core.database import get_db_manager
         
-        session = db_manager.get_session()
         try:
-            job = BackupJob(
-                name=job_name,
-                sources=json.dumps(sources),
-                include_patterns=include_patterns,
-                exclude_patterns=exclude_patterns,
-                target_type=target_type,
-                target_config=json.dumps(target_config),
-                conflict_policy=conflict_policy,
-                schedule_cron=schedule_cron
-            )
-            session.add(job)
-            session.commit()
-            
-            QMessageBox.information(self, "Success", f"Backup job '{job_name}' created successfully!")
-            self.accept()
-            
+            # Not expired on commit, so created_job stays readable after the session closes
+            with get_db_manager().session_scope(expire_on_commit=False) as session:
+                job = BackupJob(**fields)
+                session.add(job)
         except Exception as e:
-            session.rollback()
             QMessageBox.critical(self, "Error", f"Failed to create job: {str(e)}")
-        finally:
-            session.close()
+            return
+        
+        # Shown after the session is closed, so no connection is held during the dialog
+        self.created_job = job
+        QMessageBox.information(self, "Success", f"Backup job '{fields['name']}' created successfully!")
+        self.accept()
     
     def validate_job(self):
-        if not self.job_name_edit.text().strip():
+        """
+        Validate the form and collect its values
+        
+        Returns:
+            BackupJob column values, or None if validation failed. Each widget is
+            read once here and the result reused by create_job.
+        """
+        job_name = self.job_name_edit.text().strip()
+        if not job_name:
             QMessageBox.warning(self, "Validation Error", "Please enter a job name.")
-            return False
+            return None
         
-        if not self.sources_tab.get_sources():
+        sources = self.sources_tab.get_sources()
+        if not sources:
             QMessageBox.warning(self, "Validation Error", "Please add at least one source folder or file.")
-            return False
+            return None
         
-        if self.target_tab.get_target_type() == "local":
-            local_path = self.target_tab.get_target_config().get("local_path", "")
+        target_type = self.target_tab.get_target_type()
+        target_config = self.target_tab.get_target_config()
+        if target_type == "local":
+            local_path = target_config.get("local_path", "")
             if not local_path or not os.path.exists(local_path):
                 QMessageBox.warning(self, "Validation Error", "Please select a valid destination folder.")
-                return False
-        
-        return True
\ No newline at end of file
+                return None
+        
+        return {
+            'name': job_name,
+            'sources': sources,
+            'include_patterns': self.sources_tab.get_include_patterns(),
+            'exclude_patterns': self.sources_tab.get_exclude_patterns(),
+            'target_type': target_type,
+            'target_config': target_config,
+            'conflict_policy': self.target_tab.get_conflict_policy(),
+            'schedule_cron': self.schedule_tab.get_schedule_cron()
+        }
\ No newline at end of file
@@ -1,68 +1,369 @@
 import sys
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import List
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                               QPushButton, QTableWidget, QTableWidgetItem, QProgressBar,
-                               QLabel, QFrame, QSplitter, QTextEdit, QTabWidget,
+                               QPushButton, QTableView, QProgressBar,
+                               QLabel, QFrame, QSplitter, QPlainTextEdit, QTabWidget,
                                QTreeWidget, QTreeWidgetItem, QHeaderView, QMessageBox,
-                               QMenu, QMenuBar, QStatusBar, QListWidget, QListWidgetItem,
-                               QApplication)
-from PySide6.QtCore import Qt, QTimer, Signal
+                               QMenu, QMenuBar, QStatusBar, QListView,
+                               QApplication, QDialog)
+from PySide6.QtCore import (Qt, QTimer, QEvent, Signal, QObject, QRunnable, QThreadPool,
+                            QAbstractTableModel, QModelIndex)
 from PySide6.QtGui import QIcon, QFont, QPalette, QColor, QAction
 from .job_wizard import JobWizard
-from ..core.database import db_manager, BackupJob, JobExecution
+from ..core.database import get_db_manager, JobExecution
 from ..core.backup_engine import backup_engine
-from ..utils.logging_config import get_logger
+from ..utils.logging_config import get_logger, shutdown_logging
 
 logger = get_logger('main_window')
 
+# How often the long-lived database connection refreshes its planner statistics
+DB_OPTIMIZE_INTERVAL_MS = 60 * 60 * 1000
+
+# The activity view refreshes on backup engine state changes; this slow timer
+# only catches changes made outside the engine
+ACTIVITY_FALLBACK_REFRESH_MS = 30 * 1000
+
+# Jobs table refresh requests arriving within this window collapse into one
+JOBS_REFRESH_COALESCE_MS = 300
+
+# The activity log keeps only the newest lines, and appends arriving within the
+# flush window are written to it in one batch
+ACTIVITY_LOG_MAX_LINES = 2000
+ACTIVITY_LOG_FLUSH_MS = 50
+
+# Stylesheet for the main window and everything parented to it. Widgets opt in
+# through their object name instead of each parsing its own copy.
+MAIN_WINDOW_STYLESHEET = """
+    QMainWindow {
+        background-color: #f8f8f8;
+    }
+    QFrame {
+        background-color: white;
+        border: 1px solid #d2d0ce;
+        border-radius: 8px;
+    }
+    QPushButton#primaryButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-weight: 500;
+        padding: 8px 16px;
+    }
+    QPushButton#primaryButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton#primaryButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton#primaryButton:disabled {
+        background-color: #c8c6c4;
+        color: #a19f9d;
+    }
+    QPushButton#secondaryButton {
+        background-color: #f3f2f1;
+        color: #323130;
+        border: 1px solid #d2d0ce;
+        border-radius: 6px;
+        font-weight: 400;
+        padding: 8px 16px;
+    }
+    QPushButton#secondaryButton:hover {
+        background-color: #edebe9;
+        border-color: #8a8886;
+    }
+    QPushButton#secondaryButton:pressed {
+        background-color: #e1dfdd;
+    }
+    QPushButton#secondaryButton:disabled {
+        background-color: #f3f2f1;
+        color: #a19f9d;
+        border-color: #d2d0ce;
+    }
+    QTableView#jobsTable {
+        border: 1px solid #d2d0ce;
+        border-radius: 6px;
+        background-color: white;
+        gridline-color: #f3f2f1;
+        selection-background-color: #deecf9;
+    }
+    QTableView#jobsTable QHeaderView::section {
+        background-color: #f8f8f8;
+        border: none;
+        border-bottom: 1px solid #d2d0ce;
+        padding: 8px;
+        font-weight: 500;
+    }
+    QProgressBar#backupProgress {
+        border: 1px solid #d2d0ce;
+        border-radius: 6px;
+        text-align: center;
+        height: 24px;
+    }
+    QProgressBar#backupProgress::chunk {
+        background-color: #0078d4;
+        border-radius: 5px;
+    }
+    QListView#resumeList {
+        border: 1px solid #d2d0ce;
+        border-radius: 6px;
+        background-color: #faf9f8;
+        padding: 8px;
+    }
+    QListView#resumeList::item {
+        padding: 8px;
+        border-bottom: 1px solid #edebe9;
+    }
+    QPlainTextEdit#activityLog {
+        border: 1px solid #d2d0ce;
+        border-radius: 6px;
+        background-color: #faf9f8;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 12px;
+        padding: 8px;
+    }
+"""
+
+def _is_backgrounded(widget):
+    """Whether the widget's window is hidden, minimized or not the active application"""
+    return (not widget.isVisible() or widget.window().isMinimized()
+            or QApplication.applicationState() != Qt.ApplicationState.ApplicationActive)
+
 class ModernButton(QPushButton):
     def __init__(self, text, primary=False):
         super().__init__(text)
         self.setMinimumHeight(36)
-        if primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078d4;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    font-weight: 500;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-                QPushButton:disabled {
-                    background-color: #c8c6c4;
-                    color: #a19f9d;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #f3f2f1;
-                    color: #323130;
-                    border: 1px solid #d2d0ce;
-                    border-radius: 6px;
-                    font-weight: 400;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #edebe9;
-                    border-color: #8a8886;
-                }
-                QPushButton:pressed {
-                    background-color: #e1dfdd;
-                }
-                QPushButton:disabled {
-                    background-color: #f3f2f1;
-                    color: #a19f9d;
-                    border-color: #d2d0ce;
-                }
-            """)
+        # Styled through MAIN_WINDOW_STYLESHEET by object name
+        self.setObjectName("primaryButton" if primary else "secondaryButton")
+
+@dataclass
+class JobRow:
+    """Pre-formatted display values for one row of the jobs table"""
+    id: int
+    name: str
+    target: str
+    status: str
+    last_run: str
+    files: str
+
+@dataclass
+class PausedRow:
+    """Display text for one paused execution, plus the job it belongs to"""
+    id: int
+    text: str
+    job_id: int
+    job_name: str
+
+class RowTableModel(QAbstractTableModel):
+    """
+    Table model over plain row records that carry an id attribute
+    
+    Subclasses set HEADERS and the matching record FIELDS. The id of a row is
+    returned for UserRole on column 0.
+    """
+    
+    HEADERS: List[str] = []
+    FIELDS: tuple = ()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return getattr(row, self.FIELDS[index.column()])
+        if role == Qt.ItemDataRole.UserRole and index.column() == 0:
+            return row.id
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def set_rows(self, rows):
+        """Replace all rows in one model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def update_rows(self, rows):
+        """Apply a new row list, touching only the rows and cells that changed"""
+        new_ids = {row.id for row in rows}
+        
+        # Drop rows that are gone, bottom-up so indexes stay valid, and one
+        # contiguous range per signal so views don't relayout per row
+        i = len(self._rows) - 1
+        while i >= 0:
+            if self._rows[i].id in new_ids:
+                i -= 1
+                continue
+            last = i
+            while i >= 0 and self._rows[i].id not in new_ids:
+                i -= 1
+            self.beginRemoveRows(QModelIndex(), i + 1, last)
+            del self._rows[i + 1:last + 1]
+            self.endRemoveRows()
+        
+        old_ids = {row.id for row in self._rows}
+        i = 0
+        while i < len(rows):
+            new_row = rows[i]
+            if i < len(self._rows) and self._rows[i].id == new_row.id:
+                changed = [c for c, field in enumerate(self.FIELDS)
+                           if getattr(self._rows[i], field) != getattr(new_row, field)]
+                # Unchanged rows keep their existing record, so a refresh with no
+                # changes leaves the model's row list untouched
+                if changed:
+                    self._rows[i] = new_row
+                    self.dataChanged.emit(self.index(i, changed[0]), self.index(i, changed[-1]),
+                                          [Qt.ItemDataRole.DisplayRole])
+                i += 1
+            elif new_row.id not in old_ids:
+                # Insert the whole run of new rows at once (all of them on first load)
+                end = i
+                while end < len(rows) and rows[end].id not in old_ids:
+                    end += 1
+                self.beginInsertRows(QModelIndex(), i, end - 1)
+                self._rows[i:i] = rows[i:end]
+                self.endInsertRows()
+                i = end
+            else:
+                # Rows were reordered; not worth diffing
+                self.set_rows(rows)
+                return
+    
+    def append_row(self, row):
+        """Add a single row at the end"""
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
+        self._rows.append(row)
+        self.endInsertRows()
+    
+    def remove_row_by_id(self, row_id: int):
+        """Remove the row with the given id, if it is shown"""
+        for i, row in enumerate(self._rows):
+            if row.id == row_id:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+                return
+    
+    def row_at(self, row: int):
+        """Return the record shown in the given row, or None"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def row_id_at(self, row: int):
+        """Return the id of the record shown in the given row, or None"""
+        record = self.row_at(row)
+        return record.id if record is not None else None
+
+class JobsTableModel(RowTableModel):
+    """Backs the jobs table with JobRow records"""
+    
+    HEADERS = ["Name", "Target", "Status", "Last Run", "Files"]
+    FIELDS = ("name", "target", "status", "last_run", "files")
+
+class PausedJobsModel(RowTableModel):
+    """Backs the paused backups list with PausedRow records"""
+    
+    HEADERS = ["Paused Backup"]
+    FIELDS = ("text",)
+
+class JobsQuerySignals(QObject):
+    # Emits the overview rows, or None if the query failed
+    finished = Signal(object)
+
+class JobsQueryWorker(QRunnable):
+    """Loads the jobs overview on a pool thread so the GUI thread never waits on SQLite"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = JobsQuerySignals()
+    
+    def run(self):
+        try:
+            # get_job_overview_rows() opens and closes its own session, so
+            # nothing is shared with the GUI thread's sessions
+            rows = get_db_manager().get_job_overview_rows()
+        except Exception as e:
+            logger.error(f"Error loading jobs: {e}")
+            rows = None
+        self.signals.finished.emit(rows)
+
+class JobDeleteSignals(QObject):
+    # Emits the job id and whether the soft delete was written
+    finished = Signal(int, bool)
+
+class JobDeleteWorker(QRunnable):
+    """Soft-deletes a job on a pool thread, so the GUI thread never waits on a write lock"""
+    
+    def __init__(self, job_id: int):
+        super().__init__()
+        self.job_id = job_id
+        self.signals = JobDeleteSignals()
+    
+    def run(self):
+        try:
+            get_db_manager().deactivate_job(self.job_id)
+            ok = True
+        except Exception as e:
+            logger.error(f"Error deleting job {self.job_id}: {e}")
+            ok = False
+        self.signals.finished.emit(self.job_id, ok)
+
+class PausedQuerySignals(QObject):
+    # Emits the paused execution rows, or None if the query failed
+    finished = Signal(object)
+
+class PausedQueryWorker(QRunnable):
+    """Loads the paused executions on a pool thread"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = PausedQuerySignals()
+    
+    def run(self):
+        try:
+            rows = get_db_manager().get_paused_executions_rows()
+        except Exception as e:
+            logger.error(f"Error loading paused backups: {e}")
+            rows = None
+        self.signals.finished.emit(rows)
+
+class ExecutionCancelSignals(QObject):
+    # Emits the execution id and whether it was still paused and is now cancelled
+    finished = Signal(int, bool)
+
+class ExecutionCancelWorker(QRunnable):
+    """Cancels a paused execution on a pool thread"""
+    
+    def __init__(self, execution_id: int):
+        super().__init__()
+        self.execution_id = execution_id
+        self.signals = ExecutionCancelSignals()
+    
+    def run(self):
+        try:
+            ok = get_db_manager().cancel_paused_execution(self.execution_id)
+        except Exception as e:
+            logger.error(f"Error cancelling execution {self.execution_id}: {e}")
+            ok = False
+        self.signals.finished.emit(self.execution_id, ok)
 
 class JobsPanel(QWidget):
     job_selected = Signal(int)
@@ -70,8 +371,20 @@ class JobsPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.selected_job_id = None
+        self._refresh_in_progress = False
+        self._applying_rows = False
+        # Set when a refresh was skipped because nobody could see the table
+        self._refresh_dirty = False
+        self._query_worker = None
+        # Running JobDeleteWorkers and their job names by job id, kept alive
+        # until their result arrives
+        self._delete_workers = {}
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(JOBS_REFRESH_COALESCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_jobs)
         self.init_ui()
-        self.refresh_jobs()
+        self._do_refresh_jobs()
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -96,90 +409,86 @@ class JobsPanel(QWidget):
         layout.addLayout(header_layout)
         
         # Jobs table
-        self.jobs_table = QTableWidget()
-        self.jobs_table.setColumnCount(5)
-        self.jobs_table.setHorizontalHeaderLabels(["Name", "Target", "Status", "Last Run", "Files"])
+        self.jobs_model = JobsTableModel(self)
+        self.jobs_table = QTableView()
+        self.jobs_table.setModel(self.jobs_model)
+        self.jobs_table.verticalHeader().setVisible(False)
+        # QTableView only asks the model for visible cells. Fixed row heights and
+        # single-line cells keep it from measuring rows against their contents,
+        # so a large job list costs about as much as one screenful.
+        self.jobs_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.jobs_table.setWordWrap(False)
         self.jobs_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.jobs_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.jobs_table.cellClicked.connect(self.on_job_selected)
+        self.jobs_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.jobs_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.jobs_table.selectionModel().currentRowChanged.connect(self.on_job_selected)
         
         # Context menu for jobs table
         self.jobs_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.jobs_table.customContextMenuRequested.connect(self.show_context_menu)
         
-        self.jobs_table.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #d2d0ce;
-                border-radius: 6px;
-                background-color: white;
-                gridline-color: #f3f2f1;
-                selection-background-color: #deecf9;
-            }
-            QHeaderView::section {
-                background-color: #f8f8f8;
-                border: none;
-                border-bottom: 1px solid #d2d0ce;
-                padding: 8px;
-                font-weight: 500;
-            }
-        """)
+        # Built once; show_context_menu only toggles the actions
+        self._context_menu = QMenu(self)
+        
+        self._run_action = QAction("Run Job", self)
+        self._run_action.triggered.connect(self.run_selected_job)
+        self._context_menu.addAction(self._run_action)
+        
+        self._context_menu.addSeparator()
+        
+        self._edit_action = QAction("Edit Job", self)
+        self._edit_action.triggered.connect(self.edit_selected_job)
+        self._context_menu.addAction(self._edit_action)
+        
+        self._delete_action = QAction("Delete Job", self)
+        self._delete_action.triggered.connect(self.delete_selected_job)
+        self._context_menu.addAction(self._delete_action)
+        
+        self.jobs_table.setObjectName("jobsTable")
         
         layout.addWidget(self.jobs_table)
         self.setLayout(layout)
     
     def show_context_menu(self, position):
         """Show context menu for job operations"""
-        if self.jobs_table.itemAt(position):
-            menu = QMenu(self)
-            
-            run_action = QAction("Run Job", self)
-            run_action.triggered.connect(self.run_selected_job)
-            run_action.setEnabled(self.selected_job_id is not None)
-            menu.addAction(run_action)
-            
-            menu.addSeparator()
-            
-            edit_action = QAction("Edit Job", self)
-            edit_action.triggered.connect(self.edit_selected_job)
-            edit_action.setEnabled(self.selected_job_id is not None)
-            menu.addAction(edit_action)
-            
-            delete_action = QAction("Delete Job", self)
-            delete_action.triggered.connect(self.delete_selected_job)
-            delete_action.setEnabled(self.selected_job_id is not None)
-            menu.addAction(delete_action)
+        if self.jobs_table.indexAt(position).isValid():
+            has_selection = self.selected_job_id is not None
+            self._run_action.setEnabled(has_selection)
+            self._edit_action.setEnabled(has_selection)
+            self._delete_action.setEnabled(has_selection)
             
-            menu.exec(self.jobs_table.mapToGlobal(position))
+            self._context_menu.exec(self.jobs_table.mapToGlobal(position))
     
     def create_new_job(self):
         wizard = JobWizard(self)
-        if wizard.exec() == JobWizard.DialogCode.Accepted:
-            self.refresh_jobs()
+        if wizard.exec() == JobWizard.DialogCode.Accepted and wizard.created_job is not None:
+            # A new job has the highest id and has never run, so its row is
+            # known without asking the database
+            job = wizard.created_job
+            self.jobs_model.append_row(JobRow(job.id, job.name, job.target_type.title(),
+                                              "Active", "Never", "0"))
+            self._reconcile_if_loading()
     
     def run_selected_job(self):
         """Run the currently selected job"""
-        if self.selected_job_id:
+        # The row already carries the name, so nothing is read from the database here
+        job = self.selected_job_row()
+        if job is not None:
             if backup_engine.is_running:
                 QMessageBox.warning(self, "Backup Running", 
                                   "Another backup is already running. Please wait for it to complete.")
                 return
             
-            session = db_manager.get_session()
-            try:
-                job = session.query(BackupJob).filter_by(id=self.selected_job_id).first()
-                if job:
-                    reply = QMessageBox.question(self, "Run Backup Job", 
-                                               f"Are you sure you want to run '{job.name}'?",
-                                               QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                    
-                    if reply == QMessageBox.StandardButton.Yes:
-                        logger.info(f"Starting backup job: {job.name}")
-                        backup_engine.run_backup_job_async(self.selected_job_id)
-                        
-                        # Refresh the table to show updated status
-                        QTimer.singleShot(1000, self.refresh_jobs)
-            finally:
-                session.close()
+            reply = QMessageBox.question(self, "Run Backup Job", 
+                                       f"Are you sure you want to run '{job.name}'?",
+                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            
+            if reply == QMessageBox.StandardButton.Yes:
+                logger.info(f"Starting backup job: {job.name}")
+                backup_engine.run_backup_job_async(job.id)
+                
+                # Refresh the table to show updated status
+                QTimer.singleShot(1000, self.refresh_jobs)
     
     def edit_selected_job(self):
         """Edit the currently selected job"""
@@ -189,81 +498,147 @@ class JobsPanel(QWidget):
     
     def delete_selected_job(self):
         """Delete the currently selected job"""
-        if self.selected_job_id:
-            session = db_manager.get_session()
-            try:
-                job = session.query(BackupJob).filter_by(id=self.selected_job_id).first()
-                if job:
-                    reply = QMessageBox.question(self, "Delete Job", 
-                                               f"Are you sure you want to delete '{job.name}'?\n"
-                                               "This action cannot be undone.",
-                                               QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                    
-                    if reply == QMessageBox.StandardButton.Yes:
-                        job.is_active = False  # Soft delete
-                        session.commit()
-                        logger.info(f"Deleted backup job: {job.name}")
-                        self.refresh_jobs()
-                        self.selected_job_id = None
-                        self.run_job_btn.setEnabled(False)
-            finally:
-                session.close()
+        job = self.selected_job_row()
+        if job is not None:
+            reply = QMessageBox.question(self, "Delete Job", 
+                                       f"Are you sure you want to delete '{job.name}'?\n"
+                                       "This action cannot be undone.",
+                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            
+            if reply == QMessageBox.StandardButton.Yes:
+                # The soft delete is written on the pool; the row goes away now
+                # and _on_job_deleted brings it back if the write fails
+                worker = JobDeleteWorker(job.id)
+                worker.signals.finished.connect(self._on_job_deleted)
+                self._delete_workers[job.id] = (worker, job.name)
+                QThreadPool.globalInstance().start(worker)
+                
+                # Drop just this row instead of reloading the table
+                self._applying_rows = True
+                try:
+                    self.jobs_model.remove_row_by_id(job.id)
+                finally:
+                    self._applying_rows = False
+                self.jobs_table.selectionModel().clear()
+                self.selected_job_id = None
+                self.run_job_btn.setEnabled(False)
+                self._reconcile_if_loading()
+    
+    def _on_job_deleted(self, job_id, ok):
+        """Finish a delete started by delete_selected_job"""
+        _, job_name = self._delete_workers.pop(job_id, (None, job_id))
+        if ok:
+            logger.info(f"Deleted backup job: {job_name}")
+        else:
+            QMessageBox.critical(self, "Delete Failed", f"Could not delete '{job_name}'.")
+            self.refresh_jobs()
     
-    def on_job_selected(self, row, column):
-        job_id = self.jobs_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+    def on_job_selected(self, current, previous):
+        if self._applying_rows:
+            return  # Handled once after the update, see _apply_job_rows
+        
+        job_id = self.jobs_model.row_id_at(current.row()) if current.isValid() else None
         if job_id:
+            # Only announce a different job, not a re-selection of the same one
+            is_new = job_id != self.selected_job_id
             self.selected_job_id = job_id
             self.run_job_btn.setEnabled(not backup_engine.is_running)
-            self.job_selected.emit(job_id)
+            if is_new:
+                self.job_selected.emit(job_id)
+    
+    def selected_job_row(self):
+        """Return the JobRow of the current table row, or None"""
+        current = self.jobs_table.currentIndex()
+        return self.jobs_model.row_at(current.row()) if current.isValid() else None
     
     def refresh_jobs(self):
-            session = db_manager.get_session()
-            try:
-                jobs = session.query(BackupJob).filter_by(is_active=True).all()
-                self.jobs_table.setRowCount(len(jobs))
+        """Schedule a jobs table refresh; bursts of calls collapse into one"""
+        self._refresh_timer.start()
+    
+    def _reconcile_if_loading(self):
+        """Follow a local row change with a refresh if a load was already in flight"""
+        if self._refresh_in_progress:
+            # Rows queried before the change may still arrive and undo it
+            self.refresh_jobs()
+    
+    def refresh_if_dirty(self):
+        """Run a refresh that was skipped while the window was in the background"""
+        if self._refresh_dirty:
+            self._refresh_dirty = False
+            self.refresh_jobs()
+    
+    def _do_refresh_jobs(self):
+        if _is_backgrounded(self):
+            self._refresh_dirty = True
+            return
+        
+        if self._refresh_in_progress:
+            # Try again once the running refresh is done instead of overlapping it
+            self._refresh_timer.start()
+            return
+        
+        self._refresh_in_progress = True
+        # Keep a reference until the rows arrive; the signal is delivered to
+        # this panel through a queued connection on the GUI thread
+        self._query_worker = JobsQueryWorker()
+        self._query_worker.signals.finished.connect(self._apply_job_rows)
+        QThreadPool.globalInstance().start(self._query_worker)
+    
+    def _apply_job_rows(self, jobs):
+        """Update the table from rows loaded by JobsQueryWorker"""
+        self._refresh_in_progress = False
+        self._query_worker = None
+        if jobs is None:
+            return
+        
+        try:
+            current_job_id = backup_engine.get_current_job_id() if backup_engine.is_running else None
+            rows = []
+            
+            for job in jobs:
+                # Status - check if this job is currently running
+                status = "Running" if current_job_id == job.id else "Active"
                 
-                for i, job in enumerate(jobs):
-                    # Job name
-                    name_item = QTableWidgetItem(job.name)
-                    name_item.setData(Qt.ItemDataRole.UserRole, job.id)
-                    self.jobs_table.setItem(i, 0, name_item)
-                    
-                    # Target type
-                    self.jobs_table.setItem(i, 1, QTableWidgetItem(job.target_type.title()))
-                    
-                    # Status - check if this job is currently running
-                    status = "Active"
-                    if backup_engine.is_running:
-                        current_job_id = backup_engine.get_current_job_id()
-                        if current_job_id == job.id:
-                            status = "Running"
-                    self.jobs_table.setItem(i, 2, QTableWidgetItem(status))
-                    
-                    # Last run
-                    last_execution = session.query(JobExecution).filter_by(job_id=job.id).order_by(JobExecution.started_at.desc()).first()
-                    if last_execution:
-                        last_run = last_execution.started_at.strftime("%Y-%m-%d %H:%M")
-                        if last_execution.status == 'failed':
-                            last_run += " (Failed)"
-                        elif last_execution.status == 'completed_with_errors':
-                            last_run += " (Errors)"
-                    else:
-                        last_run = "Never"
-                    self.jobs_table.setItem(i, 3, QTableWidgetItem(last_run))
-                    
-                    # File count from last execution
-                    file_count = last_execution.total_files if last_execution else 0
-                    self.jobs_table.setItem(i, 4, QTableWidgetItem(str(file_count)))
-                    
-            except Exception as e:
-                logger.error(f"Error refreshing jobs: {e}")
+                # Last run and file count arrive pre-formatted from SQL
+                rows.append(JobRow(job.id, job.name, job.target_type.title(),
+                                   status, job.last_run, job.total_files))
+            
+            # Diffing keeps the view's selection and repaints only changed cells;
+            # the view repaints once after all model signals are in
+            self.jobs_table.setUpdatesEnabled(False)
+            # Row removals can move the current index several times; ignore
+            # those and look at where the selection ended up just once
+            self._applying_rows = True
+            try:
+                self.jobs_model.update_rows(rows)
             finally:
-                session.close()
+                self._applying_rows = False
+                self.jobs_table.setUpdatesEnabled(True)
+            self.on_job_selected(self.jobs_table.currentIndex(), None)
+        except Exception as e:
+            logger.error(f"Error refreshing jobs: {e}")
+    
+    def shutdown(self):
+        """Stop scheduled refreshes"""
+        self._refresh_timer.stop()
 
 class ActivityPanel(QWidget):
+    # Emitted when the user confirms stopping the running backup
+    stop_requested = Signal()
+    
     def __init__(self):
         super().__init__()
+        self._paused_worker = None
+        self._paused_refresh_pending = False
+        # Callbacks waiting for the next paused rows, see refresh_paused_jobs
+        self._paused_callbacks = []
+        # Running ExecutionCancelWorkers and their job names by execution id
+        self._cancel_workers = {}
         self.init_ui()
+        
+        # Pause and resume are requested without blocking; results arrive here
+        backup_engine.backup_paused.connect(self._on_backup_paused)
+        backup_engine.backup_resumed.connect(self._on_backup_resumed)
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -276,18 +651,7 @@ class ActivityPanel(QWidget):
         # Progress section
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #d2d0ce;
-                border-radius: 6px;
-                text-align: center;
-                height: 24px;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 5px;
-            }
-        """)
+        self.progress_bar.setObjectName("backupProgress")
         layout.addWidget(self.progress_bar)
         
         self.status_label = QLabel("No active backups")
@@ -324,9 +688,12 @@ class ActivityPanel(QWidget):
         resume_label.setFont(QFont("Segoe UI", 12, QFont.Weight.DemiBold))
         resume_layout.addWidget(resume_label)
         
-        self.paused_jobs_list = QListWidget()
+        self.paused_model = PausedJobsModel(self)
+        self.paused_jobs_list = QListView()
+        self.paused_jobs_list.setModel(self.paused_model)
+        self.paused_jobs_list.setUniformItemSizes(True)
         self.paused_jobs_list.setMaximumHeight(100)
-        self.paused_jobs_list.itemDoubleClicked.connect(self.resume_paused_job)
+        self.paused_jobs_list.doubleClicked.connect(self.resume_paused_job)
         resume_layout.addWidget(self.paused_jobs_list)
         
         resume_buttons_layout = QHBoxLayout()
@@ -349,20 +716,18 @@ class ActivityPanel(QWidget):
         log_label.setStyleSheet("margin-top: 16px; margin-bottom: 8px;")
         layout.addWidget(log_label)
         
-        self.activity_log = QTextEdit()
+        self.activity_log = QPlainTextEdit()
         self.activity_log.setReadOnly(True)
-        self.activity_log.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d2d0ce;
-                border-radius: 6px;
-                background-color: #faf9f8;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 12px;
-                padding: 8px;
-            }
-        """)
+        self.activity_log.setMaximumBlockCount(ACTIVITY_LOG_MAX_LINES)
+        self.activity_log.setObjectName("activityLog")
         layout.addWidget(self.activity_log)
         
+        self._pending_log_lines = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(ACTIVITY_LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_entries)
+        
         layout.addStretch()
         self.setLayout(layout)
         
@@ -381,13 +746,9 @@ class ActivityPanel(QWidget):
                     return
                 
                 self.add_log_entry("Requesting backup pause...")
-                
-                if backup_engine.pause_backup():
-                    self.add_log_entry("Backup paused successfully")
-                    self.update_button_states()
-                else:
-                    self.add_log_entry("Failed to pause backup")
-                    QMessageBox.warning(self, "Pause Failed", "Could not pause backup. Please try again.")
+                backup_engine.request_pause()
+                # The worker finishes its in-flight copies first; show the request now
+                self.update_button_states()
                     
             except Exception as e:
                 error_msg = f"Error pausing backup: {e}"
@@ -406,19 +767,31 @@ class ActivityPanel(QWidget):
                 return
             
             self.add_log_entry("Requesting backup resume...")
-            
-            if backup_engine.resume_backup():
-                self.add_log_entry("Backup resumed successfully")
-                self.update_button_states()
-            else:
-                self.add_log_entry("Failed to resume backup")
-                QMessageBox.warning(self, "Resume Failed", "Could not resume backup. Please try again.")
+            backup_engine.request_resume()
                 
         except Exception as e:
             error_msg = f"Error resuming backup: {e}"
             self.add_log_entry(error_msg)
             QMessageBox.critical(self, "Resume Error", f"An error occurred while resuming:\n{str(e)}")
     
+    def _on_backup_paused(self, success):
+        """Handle the outcome of a pause request"""
+        if success:
+            self.add_log_entry("Backup paused successfully")
+        else:
+            self.add_log_entry("Failed to pause backup")
+            QMessageBox.warning(self, "Pause Failed", "Could not pause backup. Please try again.")
+        self.update_button_states()
+    
+    def _on_backup_resumed(self, success):
+        """Handle the outcome of a resume request"""
+        if success:
+            self.add_log_entry("Backup resumed successfully")
+        else:
+            self.add_log_entry("Failed to resume backup")
+            QMessageBox.warning(self, "Resume Failed", "Could not resume backup. Please try again.")
+        self.update_button_states()
+    
     def stop_backup(self):
         """Stop the currently running backup"""
         try:
@@ -434,37 +807,63 @@ class ActivityPanel(QWidget):
             if reply == QMessageBox.StandardButton.Yes:
                 self.add_log_entry("Requesting backup stop...")
                 backup_engine.stop_backup()
+                self.stop_requested.emit()
                 self.update_button_states()
                 
         except Exception as e:
             error_msg = f"Error stopping backup: {e}"
             self.add_log_entry(error_msg)
             QMessageBox.critical(self, "Stop Error", f"An error occurred while stopping:\n{str(e)}")
-    def refresh_paused_jobs(self):
-        """Refresh the list of paused jobs"""
+    def refresh_paused_jobs(self, on_loaded=None):
+        """
+        Reload the list of paused jobs on the thread pool
+        
+        Args:
+            on_loaded: Optional callable given the paused execution rows (or
+                None if the query failed) once the list has been updated
+        """
+        if on_loaded is not None:
+            self._paused_callbacks.append(on_loaded)
+        
+        if self._paused_worker is not None:
+            # The running query may predate the caller's change; run another after it
+            self._paused_refresh_pending = True
+            return
+        
+        # Keep a reference until the rows arrive through the queued connection
+        self._paused_worker = PausedQueryWorker()
+        self._paused_worker.signals.finished.connect(self._apply_paused_rows)
+        QThreadPool.globalInstance().start(self._paused_worker)
+    
+    def _apply_paused_rows(self, paused_executions):
+        """Update the paused list from rows loaded by PausedQueryWorker"""
+        self._paused_worker = None
+        if self._paused_refresh_pending:
+            # Callbacks wait for the fresh rows
+            self._paused_refresh_pending = False
+            self.refresh_paused_jobs()
+            return
+        
+        callbacks, self._paused_callbacks = self._paused_callbacks, []
+        if paused_executions is not None:
+            self._show_paused_rows(paused_executions)
+        for callback in callbacks:
+            callback(paused_executions)
+    
+    def _show_paused_rows(self, paused_executions):
+        """Fill the paused list from paused execution rows"""
         try:
-            paused_executions = db_manager.get_paused_executions()
-            
-            self.paused_jobs_list.clear()
+            rows = []
+            for execution in paused_executions:
+                progress_pct = JobExecution.progress_percentage(
+                    execution.processed_files, execution.total_files
+                )
+                rows.append(PausedRow(execution.id, f"{execution.job_name} ({progress_pct}% complete)",
+                                      execution.job_id, execution.job_name))
             
-            if paused_executions:
-                self.resume_section.setVisible(True)
-                
-                session = db_manager.get_session()
-                try:
-                    for execution in paused_executions:
-                        job = session.query(BackupJob).filter_by(id=execution.job_id).first()
-                        if job:
-                            progress_pct = execution.get_progress_percentage()
-                            item_text = f"{job.name} ({progress_pct}% complete)"
-                            
-                            item = QListWidgetItem(item_text)
-                            item.setData(Qt.ItemDataRole.UserRole, execution.id)
-                            self.paused_jobs_list.addItem(item)
-                finally:
-                    session.close()
-            else:
-                self.resume_section.setVisible(False)
+            # Only changed entries are touched, so the selection survives periodic refreshes
+            self.paused_model.update_rows(rows)
+            self.resume_section.setVisible(bool(rows))
         except Exception as e:
             logger.error(f"Error refreshing paused jobs: {e}")
     
@@ -478,14 +877,14 @@ class ActivityPanel(QWidget):
             self.status_label.setText(f"RESUMED - {current_text}")
 
     
-    def resume_paused_job(self, item):
+    def resume_paused_job(self, index):
         """Resume a paused job (double-click handler)"""
         self.resume_selected_paused_job()
     
     def resume_selected_paused_job(self):
         """Resume the selected paused job"""
-        current_item = self.paused_jobs_list.currentItem()
-        if not current_item:
+        paused = self.paused_model.row_at(self.paused_jobs_list.currentIndex().row())
+        if paused is None:
             QMessageBox.information(self, "No Selection", "Please select a paused backup to resume.")
             return
         
@@ -494,73 +893,59 @@ class ActivityPanel(QWidget):
                               "Another backup is already running. Please wait for it to complete.")
             return
         
-        execution_id = current_item.data(Qt.ItemDataRole.UserRole)
+        # The joined paused-executions query already supplied the job, so
+        # resuming needs no further lookups
+        job_id = paused.job_id
+        job_name = paused.job_name
         
-        session = db_manager.get_session()
-        try:
-            execution = session.query(JobExecution).filter_by(id=execution_id).first()
-            if execution:
-                job_id = execution.job_id
-                job = session.query(BackupJob).filter_by(id=job_id).first()
-                
-                if job:
-                    reply = QMessageBox.question(self, "Resume Backup", 
-                                               f"Resume backup job '{job.name}'?",
-                                               QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                    
-                    if reply == QMessageBox.StandardButton.Yes:
-                        self.add_log_entry(f"Resuming paused backup: {job.name}")
-                        backup_engine.run_backup_job_async(job_id)
-                        self.refresh_paused_jobs()
-        finally:
-            session.close()
+        reply = QMessageBox.question(self, "Resume Backup", 
+                                   f"Resume backup job '{job_name}'?",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            self.add_log_entry(f"Resuming paused backup: {job_name}")
+            backup_engine.run_backup_job_async(job_id)
+            self.refresh_paused_jobs()
     
     def cancel_paused_job(self):
         """Cancel the selected paused job"""
-        current_item = self.paused_jobs_list.currentItem()
-        if not current_item:
+        paused = self.paused_model.row_at(self.paused_jobs_list.currentIndex().row())
+        if paused is None:
             QMessageBox.information(self, "No Selection", "Please select a paused backup to cancel.")
             return
         
-        execution_id = current_item.data(Qt.ItemDataRole.UserRole)
+        execution_id = paused.id
+        job_name = paused.job_name
         
-        session = db_manager.get_session()
-        try:
-            execution = session.query(JobExecution).filter_by(id=execution_id).first()
-            if execution:
-                job = session.query(BackupJob).filter_by(id=execution.job_id).first()
-                job_name = job.name if job else "Unknown"
-                
-                reply = QMessageBox.question(self, "Cancel Paused Backup", 
-                                           f"Are you sure you want to cancel the paused backup '{job_name}'?\n"
-                                           "This will mark it as cancelled and it cannot be resumed.",
-                                           QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    execution.status = 'cancelled'
-                    execution.completed_at = datetime.utcnow()
-                    session.commit()
-                    
-                    self.add_log_entry(f"Cancelled paused backup: {job_name}")
-                    self.refresh_paused_jobs()
-        finally:
-            session.close()
+        reply = QMessageBox.question(self, "Cancel Paused Backup", 
+                                   f"Are you sure you want to cancel the paused backup '{job_name}'?\n"
+                                   "This will mark it as cancelled and it cannot be resumed.",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            worker = ExecutionCancelWorker(execution_id)
+            worker.signals.finished.connect(self._on_paused_job_cancelled)
+            self._cancel_workers[execution_id] = (worker, job_name)
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_paused_job_cancelled(self, execution_id, ok):
+        """Finish a cancel started by cancel_paused_job"""
+        _, job_name = self._cancel_workers.pop(execution_id, (None, execution_id))
+        if ok:
+            self.add_log_entry(f"Cancelled paused backup: {job_name}")
+        else:
+            self.add_log_entry(f"Could not cancel paused backup: {job_name}")
+        self.refresh_paused_jobs()
     
     def update_button_states(self):
         """Update button visibility based on backup state"""
-        if backup_engine.is_running:
-            if backup_engine.is_paused:
-                self.pause_btn.setVisible(False)
-                self.resume_btn.setVisible(True)
-                self.stop_btn.setVisible(True)
-            else:
-                self.pause_btn.setVisible(True)
-                self.resume_btn.setVisible(False)
-                self.stop_btn.setVisible(True)
-        else:
-            self.pause_btn.setVisible(False)
-            self.resume_btn.setVisible(False)
-            self.stop_btn.setVisible(False)
+        # Read the engine state once, since progress updates call this often
+        is_running = backup_engine.is_running
+        is_paused = is_running and backup_engine.is_paused
+        
+        self.pause_btn.setVisible(is_running and not is_paused)
+        self.resume_btn.setVisible(is_paused)
+        self.stop_btn.setVisible(is_running)
     
     def update_progress(self, current, total, status_text):
         """Update the progress display"""
@@ -582,17 +967,38 @@ class ActivityPanel(QWidget):
     
     def add_log_entry(self, message):
         """Add an entry to the activity log"""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.activity_log.append(f"[{timestamp}] {message}")
+        self._pending_log_lines.append(f"[{timestamp}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log_entries(self):
+        """Write buffered log entries in one append and scroll once"""
+        if not self._pending_log_lines:
+            return
         
-        # Auto-scroll to bottom
+        # Only follow new entries if the user hasn't scrolled up to read older ones
         scrollbar = self.activity_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        self.activity_log.appendPlainText("\n".join(self._pending_log_lines))
+        self._pending_log_lines.clear()
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def shutdown(self):
+        """Drop callbacks waiting for paused rows, so none opens a dialog while closing"""
+        self._paused_callbacks.clear()
+        self._paused_refresh_pending = False
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Set when a periodic refresh was skipped while the window was in the background
+        self._activity_dirty = False
+        # PausedRows from "Resume All" still to run, started one by one as the engine goes idle
+        self._resume_queue = deque()
         self.init_ui()
         self.setup_timer()
         self.setup_menu()
@@ -604,16 +1010,8 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
         self.resize(1200, 800)
         
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f8f8;
-            }
-            QFrame {
-                background-color: white;
-                border: 1px solid #d2d0ce;
-                border-radius: 8px;
-            }
-        """)
+        # Parsed once here and matched by selector for every child widget and dialog
+        self.setStyleSheet(MAIN_WINDOW_STYLESHEET)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -638,6 +1036,7 @@ class MainWindow(QMainWindow):
         activity_layout = QVBoxLayout()
         activity_layout.setContentsMargins(16, 16, 16, 16)
         self.activity_panel = ActivityPanel()
+        self.activity_panel.stop_requested.connect(self._clear_resume_queue)
         activity_layout.addWidget(self.activity_panel)
         activity_frame.setLayout(activity_layout)
         
@@ -767,6 +1166,10 @@ class MainWindow(QMainWindow):
         cleanup_action.triggered.connect(self.cleanup_old_executions)
         tools_menu.addAction(cleanup_action)
         
+        compact_action = QAction("Optimize Database", self)
+        compact_action.triggered.connect(self.compact_database)
+        tools_menu.addAction(compact_action)
+        
         settings_action = QAction("Settings", self)
         settings_action.triggered.connect(self.show_settings)
         tools_menu.addAction(settings_action)
@@ -780,54 +1183,48 @@ class MainWindow(QMainWindow):
     
     def show_paused_backups(self):
         """Show the paused backups section"""
-        self.activity_panel.refresh_paused_jobs()
-        # If there are paused backups, scroll to them
-        if not self.activity_panel.resume_section.isVisible():
+        self.activity_panel.refresh_paused_jobs(self._on_paused_backups_shown)
+    
+    def _on_paused_backups_shown(self, paused_executions):
+        """Tell the user when the refreshed paused list turned out empty"""
+        if paused_executions is not None and not paused_executions:
             QMessageBox.information(self, "No Paused Backups", "There are no paused backups to resume.")
     
     def check_and_offer_resume(self):
         """Check for paused backups on startup and offer to resume them"""
+        self.activity_panel.refresh_paused_jobs(self._offer_resume)
+    
+    def _offer_resume(self, paused_executions):
+        """Offer to resume the paused executions found by check_and_offer_resume"""
+        if paused_executions is None:
+            self.activity_panel.add_log_entry("Error checking paused backups, see the log for details")
+            return
+        
         try:
-            paused_executions = db_manager.get_paused_executions()
-            
             if not paused_executions:
                 return  # No paused backups
             
-            # Get job names for the paused executions
-            session = db_manager.get_session()
-            try:
-                paused_jobs_info = []
-                for execution in paused_executions:
-                    job = session.query(BackupJob).filter_by(id=execution.job_id).first()
-                    if job:
-                        progress_pct = execution.get_progress_percentage()
-                        paused_jobs_info.append({
-                            'job_name': job.name,
-                            'execution_id': execution.id,
-                            'job_id': execution.job_id,
-                            'progress': progress_pct,
-                            'started_at': execution.started_at
-                        })
-                
-                if not paused_jobs_info:
-                    return
-                
-                # Show dialog to user
-                self.show_resume_dialog(paused_jobs_info)
-                
-            finally:
-                session.close()
+            paused_rows = []
+            for execution in paused_executions:
+                progress_pct = JobExecution.progress_percentage(
+                    execution.processed_files, execution.total_files
+                )
+                started_str = execution.started_at.strftime("%Y-%m-%d %H:%M")
+                paused_rows.append(PausedRow(
+                    execution.id,
+                    f"{execution.job_name} ({progress_pct}% complete) - Started: {started_str}",
+                    execution.job_id, execution.job_name
+                ))
+            
+            # Show dialog to user
+            self.show_resume_dialog(paused_rows)
                 
         except Exception as e:
             logger.error(f"Error checking for paused backups: {e}")
             self.activity_panel.add_log_entry(f"Error checking paused backups: {e}")
 
-    def show_resume_dialog(self, paused_jobs_info):
+    def show_resume_dialog(self, paused_rows):
         """Show dialog asking user if they want to resume paused backups"""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem
-        from PySide6.QtCore import Qt
-        from PySide6.QtGui import QFont
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("Resume Paused Backups")
         dialog.setMinimumSize(500, 300)
@@ -842,36 +1239,20 @@ class MainWindow(QMainWindow):
         layout.addWidget(title)
         
         # Message
-        message = QLabel(f"Found {len(paused_jobs_info)} paused backup(s) from your previous session.\n"
+        message = QLabel(f"Found {len(paused_rows)} paused backup(s) from your previous session.\n"
                         "Would you like to resume them?")
         message.setWordWrap(True)
         message.setAlignment(Qt.AlignmentFlag.AlignCenter)
         message.setStyleSheet("margin: 10px; color: #605e5c;")
         layout.addWidget(message)
         
-        # List of paused jobs
-        jobs_list = QListWidget()
-        jobs_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #d2d0ce;
-                border-radius: 6px;
-                background-color: #faf9f8;
-                padding: 8px;
-            }
-            QListWidgetItem {
-                padding: 8px;
-                border-bottom: 1px solid #edebe9;
-            }
-        """)
-        
-        for job_info in paused_jobs_info:
-            started_str = job_info['started_at'].strftime("%Y-%m-%d %H:%M")
-            item_text = f"{job_info['job_name']} ({job_info['progress']}% complete) - Started: {started_str}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, job_info)
-            jobs_list.addItem(item)
-        
+        # List of paused jobs, filled in a single model reset
+        jobs_model = PausedJobsModel(dialog)
+        jobs_model.set_rows(paused_rows)
+        jobs_list = QListView()
+        jobs_list.setObjectName("resumeList")
+        jobs_list.setModel(jobs_model)
+        jobs_list.setUniformItemSizes(True)
         layout.addWidget(jobs_list)
         
         # Buttons
@@ -882,11 +1263,13 @@ class MainWindow(QMainWindow):
         buttons_layout.addWidget(cancel_btn)
         
         resume_all_btn = ModernButton("Resume All", primary=True)
-        resume_all_btn.clicked.connect(lambda: self.handle_resume_all(paused_jobs_info, dialog))
+        resume_all_btn.clicked.connect(lambda: self.handle_resume_all(paused_rows, dialog))
         buttons_layout.addWidget(resume_all_btn)
         
         resume_selected_btn = ModernButton("Resume Selected")
-        resume_selected_btn.clicked.connect(lambda: self.handle_resume_selected(jobs_list, dialog))
+        resume_selected_btn.clicked.connect(
+            lambda: self.handle_resume_selected(jobs_model.row_at(jobs_list.currentIndex().row()), dialog)
+        )
         buttons_layout.addWidget(resume_selected_btn)
         
         buttons_layout.addStretch()
@@ -897,7 +1280,7 @@ class MainWindow(QMainWindow):
         # Show dialog non-blocking
         QTimer.singleShot(1000, dialog.show)  # Delay to let main window load first
 
-    def handle_resume_all(self, paused_jobs_info, dialog):
+    def handle_resume_all(self, paused_rows, dialog):
         """Handle resuming all paused jobs"""
         if backup_engine.is_running:
             QMessageBox.warning(dialog, "Backup Running", 
@@ -907,22 +1290,53 @@ class MainWindow(QMainWindow):
         dialog.accept()
         
         # Resume the first job (we can only run one at a time)
-        if paused_jobs_info:
-            first_job = paused_jobs_info[0]
-            self.activity_panel.add_log_entry(f"Auto-resuming: {first_job['job_name']}")
-            backup_engine.run_backup_job_async(first_job['job_id'])
+        if paused_rows:
+            first_job = paused_rows[0]
+            self.activity_panel.add_log_entry(f"Auto-resuming: {first_job.job_name}")
+            backup_engine.run_backup_job_async(first_job.job_id)
             
-            # Queue the rest for later
-            if len(paused_jobs_info) > 1:
-                self.activity_panel.add_log_entry(f"Queued {len(paused_jobs_info) - 1} additional paused backups for later")
+            # The rest start in turn each time the engine goes idle
+            if len(paused_rows) > 1:
+                self._resume_queue.extend(paused_rows[1:])
+                self.activity_panel.add_log_entry(f"Queued {len(paused_rows) - 1} additional paused backups")
                 QMessageBox.information(self, "Multiple Backups", 
-                                    f"Resumed '{first_job['job_name']}'. The remaining {len(paused_jobs_info) - 1} "
-                                    "paused backups are available in the Activity panel.")
+                                    f"Resumed '{first_job.job_name}'. The remaining {len(paused_rows) - 1} "
+                                    "paused backups will resume automatically, one after another.")
+    
+    def _start_next_queued_resume(self):
+        """Resume the next queued paused backup that is still waiting, if any"""
+        if backup_engine.is_running or not self._resume_queue:
+            return
+        
+        self.activity_panel.refresh_paused_jobs(self._resume_next_from)
+    
+    def _resume_next_from(self, paused_executions):
+        """Resume the first queued backup that is among the paused executions"""
+        if paused_executions is None:
+            self._resume_queue.clear()
+            return
+        # The engine may have been started while the paused list was loading
+        if backup_engine.is_running:
+            return
+        
+        # Skip entries the user already resumed or cancelled from the Activity panel
+        still_paused = {row.id for row in paused_executions}
+        while self._resume_queue:
+            paused = self._resume_queue.popleft()
+            if paused.id in still_paused:
+                self.activity_panel.add_log_entry(f"Auto-resuming: {paused.job_name}")
+                backup_engine.run_backup_job_async(paused.job_id)
+                return
+    
+    def _clear_resume_queue(self):
+        """Drop queued resumes, e.g. after the user stopped the running backup"""
+        if self._resume_queue:
+            self.activity_panel.add_log_entry(f"Cancelled {len(self._resume_queue)} queued paused backups")
+            self._resume_queue.clear()
 
-    def handle_resume_selected(self, jobs_list, dialog):
+    def handle_resume_selected(self, paused, dialog):
         """Handle resuming selected paused job"""
-        current_item = jobs_list.currentItem()
-        if not current_item:
+        if paused is None:
             QMessageBox.information(dialog, "No Selection", "Please select a backup to resume.")
             return
         
@@ -931,11 +1345,10 @@ class MainWindow(QMainWindow):
                             "A backup is already running. Please wait for it to complete.")
             return
         
-        job_info = current_item.data(Qt.ItemDataRole.UserRole)
         dialog.accept()
         
-        self.activity_panel.add_log_entry(f"Auto-resuming selected: {job_info['job_name']}")
-        backup_engine.run_backup_job_async(job_info['job_id'])
+        self.activity_panel.add_log_entry(f"Auto-resuming selected: {paused.job_name}")
+        backup_engine.run_backup_job_async(paused.job_id)
         
     def cleanup_old_executions(self):
         """Clean up old execution records"""
@@ -949,12 +1362,26 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                count = db_manager.cleanup_old_executions()
+                count = get_db_manager().cleanup_old_executions()
                 QMessageBox.information(self, "Cleanup Complete", f"Removed {count} old execution records.")
                 self.activity_panel.add_log_entry(f"Cleaned up {count} old execution records")
         except Exception as e:
             QMessageBox.critical(self, "Cleanup Error", f"Failed to cleanup old executions: {str(e)}")
     
+    def compact_database(self):
+        """Rebuild database statistics and compact the database file"""
+        if backup_engine.is_running:
+            QMessageBox.warning(self, "Backup Running",
+                              "Please wait for the running backup to finish before optimizing the database.")
+            return
+        
+        try:
+            get_db_manager().optimize(full=True)
+            self.activity_panel.add_log_entry("Database optimized")
+            QMessageBox.information(self, "Optimize Complete", "The database has been analyzed and compacted.")
+        except Exception as e:
+            QMessageBox.critical(self, "Optimize Error", f"Failed to optimize the database: {str(e)}")
+    
     def show_settings(self):
         """Show settings dialog"""
         QMessageBox.information(self, "Settings", 
@@ -974,25 +1401,69 @@ class MainWindow(QMainWindow):
     
     def setup_timer(self):
         """Setup refresh timer"""
+        backup_engine.state_changed.connect(self._on_engine_state_changed)
+        
         self.timer = QTimer()
         self.timer.timeout.connect(self.refresh_activity)
-        self.timer.start(5000)  # Refresh every 5 seconds
+        self.timer.start(ACTIVITY_FALLBACK_REFRESH_MS)
+        
+        self.optimize_timer = QTimer()
+        self.optimize_timer.timeout.connect(self.optimize_database)
+        self.optimize_timer.start(DB_OPTIMIZE_INTERVAL_MS)
+        
+        QApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
     
-    def on_job_selected(self, job_id):
-        """Handle job selection"""
-        session = db_manager.get_session()
+    def _on_engine_state_changed(self, state):
+        """Refresh the views that depend on whether a backup is running"""
+        if state == 'idle':
+            self._start_next_queued_resume()
+        self.refresh_activity()
+        self.jobs_panel.refresh_jobs()
+    
+    def _resume_polling(self):
+        """Catch up on refreshes skipped while the window was in the background"""
+        if _is_backgrounded(self):
+            return
+        
+        self.jobs_panel.refresh_if_dirty()
+        if self._activity_dirty:
+            self._activity_dirty = False
+            self.refresh_activity()
+    
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationState.ApplicationActive:
+            self._resume_polling()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._resume_polling()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._resume_polling()
+    
+    def optimize_database(self):
+        """Periodically refresh SQLite planner statistics"""
         try:
-            job = session.query(BackupJob).filter_by(id=job_id).first()
-            if job:
-                self.activity_panel.add_log_entry(f"Selected job: {job.name}")
-                self.status_bar.showMessage(f"Selected: {job.name}")
+            get_db_manager().run_optimize()
         except Exception as e:
-            logger.error(f"Error handling job selection: {e}")
-        finally:
-            session.close()
+            logger.error(f"Error optimizing database: {e}")
+    
+    def on_job_selected(self, job_id):
+        """Handle job selection"""
+        # The clicked row already carries the job's name, so no query is needed
+        job = self.jobs_panel.selected_job_row()
+        if job is not None and job.id == job_id:
+            self.activity_panel.add_log_entry(f"Selected job: {job.name}")
+            self.status_bar.showMessage(f"Selected: {job.name}")
     
     def refresh_activity(self):
         """Refresh activity display periodically"""
+        if _is_backgrounded(self):
+            self._activity_dirty = True
+            return
+        
         # Refresh jobs panel if backup state changed
         current_running = backup_engine.is_running
         
@@ -1058,7 +1529,10 @@ class MainWindow(QMainWindow):
         """Clean up resources and accept close event for normal shutdown"""
         if hasattr(self, 'timer'):
             self.timer.stop()
-        db_manager.close()
+        self.jobs_panel.shutdown()
+        self.activity_panel.shutdown()
+        get_db_manager().close()
+        shutdown_logging()
         event.accept()
 
     def _cleanup_and_exit(self):
@@ -1070,7 +1544,10 @@ class MainWindow(QMainWindow):
             self.timer.stop()
         
         # Close database connection
-        db_manager.close()
+        self.jobs_panel.shutdown()
+        self.activity_panel.shutdown()
+        get_db_manager().close()
+        shutdown_logging()
         
         # Force exit the application
         import sys
@@ -1089,6 +1566,6 @@ class MainWindow(QMainWindow):
     def _finalize_close(self):
         """Finalize the application close"""
         logger.info("Application closing")
-        db_manager.close()
+        get_db_manager().close()
         # Don't try to access the event object here
         self.close() if not self.isVisible() else None
\ No newline at end of file
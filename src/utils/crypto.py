@@ -1,9 +1,47 @@
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
+import hashlib
+import json
+import mmap
 import os
+import functools
+import threading
 import keyring
+from typing import Dict, Optional, Tuple
+
+try:
+    import blake3
+except ImportError:  # Optional SIMD-accelerated hash
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # Optional C JSON codec that works on bytes directly
+    orjson = None
+
+# Files at least this large are hashed by blake3 on all cores; below it the
+# thread pool handoff costs more than it saves
+BLAKE3_THREADED_MIN_SIZE = 16 * 1024 * 1024
+
+# Files at least this large are hashed from a memory map in one update() call
+MMAP_HASH_MIN_SIZE = 16 * 1024 * 1024
+
+# Keeps two first uses from each generating (and storing) a different key
+_key_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _load_encryption_key(service_name: str) -> bytes:
+    """Get or create the encryption key in the OS keyring, once per process"""
+    with _key_lock:
+        key = keyring.get_password(service_name, "encryption_key")
+        
+        if key is None:
+            # Generate new key
+            key = Fernet.generate_key().decode()
+            keyring.set_password(service_name, "encryption_key", key)
+        
+        return key.encode()
 
 class CredentialManager:
     """Secure credential storage using OS keyring and encryption"""
@@ -11,33 +49,40 @@ class CredentialManager:
     SERVICE_NAME = "BackupManagerPro"
     
     def __init__(self):
-        self.key = self._get_or_create_encryption_key()
-        self.cipher = Fernet(self.key)
+        # The keyring is a D-Bus/Security framework round trip, so it is only
+        # contacted the first time something is encrypted or decrypted
+        self._cipher = None
+        # Decrypted token JSON by service_id, kept in step by store/delete_token.
+        # The bytes are cached rather than the dict, so callers can't alter it.
+        self._token_cache: Dict[str, bytes] = {}
+    
+    @property
+    def cipher(self) -> Fernet:
+        """Fernet cipher for the stored encryption key, created on first use"""
+        if self._cipher is None:
+            self._cipher = Fernet(self._get_or_create_encryption_key())
+        return self._cipher
     
     def _get_or_create_encryption_key(self):
         """Get or create encryption key stored in OS keyring"""
-        key = keyring.get_password(self.SERVICE_NAME, "encryption_key")
-        
-        if key is None:
-            # Generate new key
-            key = Fernet.generate_key().decode()
-            keyring.set_password(self.SERVICE_NAME, "encryption_key", key)
-        
-        return key.encode()
+        return _load_encryption_key(self.SERVICE_NAME)
     
     def store_token(self, service_id: str, token_data: dict):
         """Store encrypted token data"""
         try:
-            # Convert token data to JSON string
-            import json
-            token_json = json.dumps(token_data)
+            # Convert token data to JSON bytes
+            if orjson is not None:
+                token_json = orjson.dumps(token_data)
+            else:
+                token_json = json.dumps(token_data).encode()
             
             # Encrypt the token
-            encrypted_token = self.cipher.encrypt(token_json.encode())
+            encrypted_token = self.cipher.encrypt(token_json)
             
             # Store in keyring as base64
-            encoded_token = base64.b64encode(encrypted_token).decode()
+            encoded_token = base64.b64encode(encrypted_token).decode('ascii')
             keyring.set_password(self.SERVICE_NAME, f"token_{service_id}", encoded_token)
+            self._token_cache[service_id] = token_json
             
             return True
         except Exception as e:
@@ -47,26 +92,29 @@ class CredentialManager:
     def retrieve_token(self, service_id: str) -> dict:
         """Retrieve and decrypt token data"""
         try:
-            # Get from keyring
-            encoded_token = keyring.get_password(self.SERVICE_NAME, f"token_{service_id}")
-            if encoded_token is None:
-                return None
+            token_json = self._token_cache.get(service_id)
+            if token_json is None:
+                # Get from keyring
+                encoded_token = keyring.get_password(self.SERVICE_NAME, f"token_{service_id}")
+                if encoded_token is None:
+                    return None
+                
+                # Decode and decrypt
+                encrypted_token = base64.b64decode(encoded_token)
+                token_json = self.cipher.decrypt(encrypted_token)
+                self._token_cache[service_id] = token_json
             
-            # Decode and decrypt
-            encrypted_token = base64.b64decode(encoded_token)
-            decrypted_token = self.cipher.decrypt(encrypted_token)
-            
-            # Parse JSON
-            import json
-            token_data = json.loads(decrypted_token.decode())
-            
-            return token_data
+            # Parse JSON; both parsers accept bytes without a decode step
+            if orjson is not None:
+                return orjson.loads(token_json)
+            return json.loads(token_json)
         except Exception as e:
             print(f"Error retrieving token: {e}")
             return None
     
     def delete_token(self, service_id: str):
         """Delete stored token"""
+        self._token_cache.pop(service_id, None)
         try:
             keyring.delete_password(self.SERVICE_NAME, f"token_{service_id}")
             return True
@@ -88,34 +136,181 @@ class CredentialManager:
 class FileHasher:
     """Utility class for file integrity verification"""
     
+    # Integrity checks are not adversarial, so prefer the fastest available hash.
+    # Pass algorithm='sha256' where a cryptographic guarantee is required.
+    DEFAULT_ALGORITHM = 'blake3' if blake3 is not None else 'blake2b'
+    
     @staticmethod
-    def calculate_file_hash(file_path: str, algorithm='sha256', chunk_size: int = 8192) -> str:
-        """Calculate hash of a file"""
-        if algorithm == 'sha256':
-            hasher = hashes.SHA256()
-        elif algorithm == 'md5':
-            hasher = hashes.MD5()
+    def _create_digest(algorithm: Optional[str] = None, threaded: bool = False):
+        """Create a new hash context for the given algorithm
+        
+        Args:
+            algorithm: Hash algorithm name, DEFAULT_ALGORITHM if not given
+            threaded: Let blake3 split the input across cores; ignored by other algorithms
+        """
+        algorithm = algorithm or FileHasher.DEFAULT_ALGORITHM
+        
+        if algorithm == 'blake3':
+            if blake3 is None:
+                raise ValueError("The blake3 package is not installed")
+            if threaded:
+                return blake3.blake3(max_threads=blake3.blake3.AUTO)
+            return blake3.blake3()
+        elif algorithm == 'blake2b':
+            # 32-byte digest keeps hex checksums at 64 characters like SHA-256
+            return hashlib.blake2b(digest_size=32)
+        elif algorithm in ('sha256', 'md5'):
+            # hashlib calls OpenSSL directly (SHA-NI where the CPU has it),
+            # without the cffi hop of cryptography's hashes.Hash on every update
+            return hashlib.new(algorithm)
         else:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
+    
+    @staticmethod
+    def _hexdigest(digest) -> str:
+        """Finish a hash context created by _create_digest and return it as hex"""
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _update_mapped(digest, f) -> bool:
+        """Feed an open file to digest through a read-only memory map; False if it can't be mapped"""
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False  # e.g. some network filesystems, or the file was emptied meanwhile
         
-        digest = hashes.Hash(hasher)
+        with mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            # A single call: hashlib releases the GIL and walks the page cache directly
+            digest.update(mapped)
+        return True
+    
+    @staticmethod
+    def calculate_file_hash(file_path: str, algorithm: Optional[str] = None, chunk_size: int = 1 << 20) -> str:
+        """Calculate hash of a file"""
+        algorithm = algorithm or FileHasher.DEFAULT_ALGORITHM
         
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    digest.update(chunk)
+            size = os.path.getsize(file_path)
+            threaded = algorithm == 'blake3' and size >= BLAKE3_THREADED_MIN_SIZE
+            digest = FileHasher._create_digest(algorithm, threaded)
+            
+            if hasattr(digest, 'update_mmap'):
+                # blake3 memory-maps the file and hashes it across SIMD lanes
+                digest.update_mmap(file_path)
+                return FileHasher._hexdigest(digest)
             
-            return digest.finalize().hex()
+            with open(file_path, 'rb', buffering=0) as f:
+                if size >= MMAP_HASH_MIN_SIZE and FileHasher._update_mapped(digest, f):
+                    return FileHasher._hexdigest(digest)
+                
+                if hasattr(os, 'posix_fadvise'):
+                    # Let the kernel read ahead aggressively for this single pass
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the read loop runs in C and releases the GIL
+                    hashlib.file_digest(f, lambda: digest)  # Fills digest in place
+                else:
+                    # Reuse one buffer instead of allocating a bytes object per chunk
+                    buf = bytearray(chunk_size)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        digest.update(view[:n])
+            
+            return FileHasher._hexdigest(digest)
         except (IOError, OSError) as e:
             raise Exception(f"Error calculating hash for {file_path}: {e}")
     
     @staticmethod
-    def verify_file_integrity(source_path: str, target_path: str) -> bool:
-        """Verify two files have the same content by comparing hashes"""
+    def copy_and_hash(source_path: str, target_path: str, algorithm: Optional[str] = None,
+                      verify: bool = False, buf_size: int = 1 << 20) -> Tuple[str, Optional[str]]:
+        """
+        Copy a file while hashing it in a single pass over the source
+        
+        Args:
+            source_path: File to read
+            target_path: File to write (created or truncated)
+            algorithm: Hash algorithm name
+            verify: Re-read the written file and hash it as well
+            buf_size: Size of the reusable copy buffer
+            
+        Returns:
+            Tuple of (source_hash, target_hash); target_hash is None unless verify is set
+        """
+        digest = FileHasher._create_digest(algorithm)
+        buf = bytearray(buf_size)
+        view = memoryview(buf)
+        
+        try:
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                while True:
+                    n = src.readinto(buf)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    dst.write(view[:n])
+        except (IOError, OSError) as e:
+            raise Exception(f"Error copying {source_path} to {target_path}: {e}")
+        
+        source_hash = FileHasher._hexdigest(digest)
+        target_hash = FileHasher.calculate_file_hash(target_path, algorithm) if verify else None
+        return source_hash, target_hash
+    
+    @staticmethod
+    def fast_compare(source_path: str, target_path: str, buf_size: int = 4 << 20) -> bool:
+        """
+        Compare two files byte for byte, stopping at the first difference
+        
+        Cheaper than hashing both when only equality matters: no digest work,
+        and a mismatch ends the read early. Large reads keep the seeking down
+        when both files are on the same disk.
+        """
+        buf_a = bytearray(buf_size)
+        buf_b = bytearray(buf_size)
+        with open(source_path, 'rb') as a, open(target_path, 'rb') as b:
+            while True:
+                # Buffered readinto only comes back short at end of file
+                n = a.readinto(buf_a)
+                if n != b.readinto(buf_b):
+                    return False
+                if n < buf_size:
+                    return buf_a[:n] == buf_b[:n]
+                if buf_a != buf_b:
+                    return False
+    
+    @staticmethod
+    def verify_file_integrity(source_path: str, target_path: str, source_hash: Optional[str] = None,
+                              algorithm: Optional[str] = None) -> bool:
+        """
+        Verify two files have the same content
+        
+        Args:
+            source_path: Original file
+            target_path: Copy to check
+            source_hash: Hash of the source if already known, e.g. from
+                copy_and_hash; the source is then not read again and only the
+                target is hashed. Without it the files are compared directly.
+            algorithm: Hash algorithm name; must match source_hash if given
+        """
         try:
-            source_hash = FileHasher.calculate_file_hash(source_path)
-            target_hash = FileHasher.calculate_file_hash(target_path)
-            return source_hash == target_hash
+            # One stat per file answers both the same-file and the size check
+            source_stat = os.stat(source_path)
+            target_stat = os.stat(target_path)
+            if os.path.samestat(source_stat, target_stat):
+                return True  # Same device and inode, e.g. a hard link
+            if source_stat.st_size != target_stat.st_size:
+                return False
+            
+            if source_hash is not None:
+                return FileHasher.calculate_file_hash(target_path, algorithm) == source_hash
+            
+            # Nobody needs the hashes themselves, so skip computing them
+            return FileHasher.fast_compare(source_path, target_path)
         except Exception:
             return False
 
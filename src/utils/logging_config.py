@@ -1,19 +1,24 @@
+import atexit
 import logging
-import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Size at which backup.log is rotated to backup.log.1, .2, ...
+LOG_MAX_BYTES = 10 * 1024 * 1024
+
 class BackupLogger:
     def __init__(self, log_dir="logs", max_log_files=10):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         self.max_log_files = max_log_files
+        self._listener = None
+        self._queue_handler = None
         self.setup_logging()
     
     def setup_logging(self):
         """Setup logging configuration with file rotation"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = self.log_dir / f"backup_{timestamp}.log"
+        log_file = self.log_dir / "backup.log"
         
         # Create formatter
         formatter = logging.Formatter(
@@ -21,8 +26,10 @@ class BackupLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # Setup file handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Setup file handler. Rotation happens in-process by size, so startup
+        # doesn't have to scan the log directory for old files to prune.
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES,
+                                           backupCount=self.max_log_files, encoding='utf-8')
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)
         
@@ -31,28 +38,44 @@ class BackupLogger:
         console_handler.setFormatter(formatter)
         console_handler.setLevel(logging.INFO)
         
+        # Callers (the GUI thread included) only enqueue records; the listener
+        # thread does the formatting and disk writes
+        log_queue = queue.Queue(-1)
+        self._listener = QueueListener(log_queue, file_handler, console_handler,
+                                       respect_handler_level=True)
+        self._listener.start()
+        
         # Configure root logger
         logger = logging.getLogger('backup_app')
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        self._queue_handler = QueueHandler(log_queue)
+        logger.addHandler(self._queue_handler)
         
-        # Clean old log files
-        self.cleanup_old_logs()
+        # Also covers exits that skip the window's cleanup, and runs before
+        # logging's own atexit hook closes the handlers
+        atexit.register(self.close)
         
         return logger
     
-    def cleanup_old_logs(self):
-        """Remove old log files, keeping only the most recent ones"""
-        log_files = list(self.log_dir.glob("backup_*.log"))
-        if len(log_files) > self.max_log_files:
-            # Sort by modification time and remove oldest
-            log_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            for old_log in log_files[self.max_log_files:]:
-                try:
-                    old_log.unlink()
-                except OSError:
-                    pass
+    def close(self):
+        """
+        Flush queued records and stop the logging thread
+        
+        Records logged afterwards are written directly by the file and console
+        handlers instead of going into a queue nobody drains.
+        """
+        if self._listener is None:
+            return
+        
+        logger = logging.getLogger('backup_app')
+        logger.removeHandler(self._queue_handler)
+        for handler in self._listener.handlers:
+            logger.addHandler(handler)
+        
+        # Writes out everything still queued before returning
+        self._listener.stop()
+        self._listener = None
+        self._queue_handler = None
     
     def get_logger(self, name):
         """Get a logger instance for a specific module"""
@@ -63,4 +86,8 @@ backup_logger = BackupLogger()
 
 def get_logger(name):
     """Convenience function to get a logger"""
-    return backup_logger.get_logger(name)
\ No newline at end of file
+    return backup_logger.get_logger(name)
+
+def shutdown_logging():
+    """Flush and stop background logging; call once on application exit"""
+    backup_logger.close()
\ No newline at end of file